@@ -1,27 +1,114 @@
 import asyncio
+import logging
+import os
 import random
 import secrets
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import discord
 from redbot.core import commands, Config
+from redbot.core.data_manager import cog_data_path
+from redbot.core.utils.chat_formatting import pagify
+
+from .cache import RuleCache
+from .coordination import LeaseBusy, SharedCoordinator
+from .expiry import ExpiryScheduler
+from .jobs import (
+    CANCELLED,
+    CHECKPOINT_EVERY,
+    RUNNING,
+    SUSPENDED,
+    BatchExecutor,
+    BatchJob,
+    JobQueue,
+    ProgressMessage,
+    Step,
+)
+from .logsink import LogAggregator, LogRecord
+from .matcher import CorpusReport, KeywordMatcher, run_corpus
+from .metrics import Metrics
+from .models import OperationResult
+from .planner import (
+    OP_CREATE,
+    OP_DELETE,
+    RULE_CAPS,
+    TRIGGER_TYPE_KEYWORD,
+    TRIGGER_TYPE_KEYWORD_PRESET,
+    TRIGGER_TYPE_MENTION_SPAM,
+    TRIGGER_TYPE_SPAM,
+    CapacityPlan,
+    DesiredState,
+    Plan,
+    RuleView,
+    plan_capacity,
+    plan_changes,
+)
+from .ratelimit import RateLimitScheduler
+from .records import RuleRecord
+from .retry import NETWORK_ERRORS, RetryBudget, RetryPolicy, call_with_retry
+from .settings import SettingsCache
+from .snapshot import SnapshotError, SnapshotRule, SnapshotStream, read_header, write_snapshot
+from .store import SeedRecord, SeedStore
+from .validation import (
+    ACTION_BLOCK_MESSAGE,
+    ACTION_SEND_ALERT,
+    EVENT_TYPE_MESSAGE_SEND,
+    MAX_KEYWORDS_PER_RULE,
+    PayloadError,
+    validate_rule_payload,
+)
 
 OWNER_USER_ID = 1448530688558235719
 RULE_NAME_PREFIX = "[AMSEED]"
 DEFAULT_CREATE_COUNT = 10
+DEFAULT_FLEET_CONCURRENCY = 4
+RULE_CACHE_TTL = 300.0
+METRICS_EXPORT_INTERVAL = 60.0
+# Cross-process guild lease: held while a job runs, renewed every TTL / 3.
+LEASE_TTL = 30.0
+LEASE_WAIT = 60.0
+LEASE_POLL_INTERVAL = 1.0
+# A job that cannot get (or keeps) its lease retries in-process with doubling
+# delays, then fails rather than waiting for the next load.
+LEASE_RETRIES = 4
+LEASE_RETRY_DELAY = 30.0
+# create TTL bounds, and how long a failed expiry waits before trying again.
+MIN_SEED_TTL = timedelta(minutes=1)
+MAX_SEED_TTL = timedelta(days=30)
+EXPIRY_RETRY_DELAY = 300.0
+METRICS_FILE_NAME = "metrics.prom"
+SNAPSHOT_DIR_NAME = "snapshots"
+COORDINATION_FILE_NAME = "coordination.sqlite3"
+
+# Trigger types `create` can seed besides keyword rules, by command name.
+SEED_TRIGGER_TYPES = {
+    "keyword": TRIGGER_TYPE_KEYWORD,
+    "spam": TRIGGER_TYPE_SPAM,
+    "preset": TRIGGER_TYPE_KEYWORD_PRESET,
+    "mention": TRIGGER_TYPE_MENTION_SPAM,
+}
+# Profanity, sexual content and slurs.
+SEED_KEYWORD_PRESETS = [1, 2, 3]
+SEED_MENTION_LIMIT = 20
 
-ACTION_BLOCK_MESSAGE = 1
-ACTION_SEND_ALERT = 2
+log = logging.getLogger("red.automodseeder")
 
-TRIGGER_TYPE_KEYWORD = 1
-EVENT_TYPE_MESSAGE_SEND = 1
+MANAGE_GUILD_REQUIRED = "봇에 서버 관리(Manage Guild) 권한이 필요합니다."
 
-CREATE_SLEEP_MIN = 0.35
-CREATE_SLEEP_MAX = 0.9
-BATCH_SLEEP_EVERY = 5
-BATCH_SLEEP_SECONDS = 1.5
+CREATE_STOP_NOTES = {
+    400: "서버 AutoMod 제한 또는 파라미터 오류 가능",
+    403: "권한 부족으로 중단됨",
+    404: "권한 또는 대상 오류로 중단됨",
+    429: "레이트리밋(429) 재시도 한도 초과로 중단됨",
+}
+BULK_STOP_NOTES = {403: "권한 부족", 429: "레이트리밋"}
+LEASE_BUSY_NOTE = "다른 봇 프로세스가 이 길드의 작업을 처리 중"
+LEASE_LOST_NOTE = "작업 임대를 다른 봇 프로세스에 빼앗김"
+LEASE_RESUME_NOTE = "다음 로드 때 이어서 실행"
+LEASE_GIVE_UP_NOTE = f"{LEASE_RETRIES}회 재시도 후 작업 중단"
 
 CUSTOM_MESSAGE = (
     "AutoMod seed rule (badge test). If this blocks unexpectedly, delete the rule."
@@ -36,6 +123,7 @@ class AutoModSeeder(commands.Cog):
         self.config = Config.get_conf(self, identifier=8237451234, force_registration=True)
         self.config.register_guild(
             owner_user_id=OWNER_USER_ID,
+            # Legacy: migrated into the SQLite seed store on first load.
             seeded_rule_ids=[],
             last_run_ts=0,
             default_count=DEFAULT_CREATE_COUNT,
@@ -45,7 +133,83 @@ class AutoModSeeder(commands.Cog):
             allow_alert_mode=False,
             action_mode="block",
             silent_denied=False,
+            jobs={},
+        )
+        self.config.register_global(
+            fleet_concurrency=DEFAULT_FLEET_CONCURRENCY,
+            store_migrated=False,
+            metrics_file=False,
+            # None keeps the file in the cog data folder.
+            coordination_path=None,
         )
+        self.store = SeedStore(cog_data_path(self) / "seeded.sqlite3")
+        self.settings = SettingsCache(self.config)
+        self.ratelimiter = RateLimitScheduler()
+        self.metrics = Metrics()
+        # Opened in cog_load, from the configured path.
+        self.coordinator: Optional[SharedCoordinator] = None
+        self.rule_caps = dict(RULE_CAPS)
+        self._lease_owner = f"{os.getpid()}:{secrets.token_hex(4)}"
+        self.log_sink = LogAggregator(self._resolve_log_channel, self._build_log_embed)
+        self.retry_policy = RetryPolicy()
+        self.rule_cache: RuleCache[RuleRecord] = RuleCache(RULE_CACHE_TTL)
+        self._executor = BatchExecutor(self._save_job)
+        self._queue = JobQueue(self._process_job)
+        self.expiry = ExpiryScheduler(self._expire_rules)
+        self._startup_task: Optional[asyncio.Task] = None
+        self._metrics_task: Optional[asyncio.Task] = None
+        self._metrics_file_enabled = False
+        self._loaded_at = time.time()
+        self._unloading = False
+        # Checkpointed jobs from an earlier load, resumed once the bot is ready.
+        self._resumable: List[BatchJob] = []
+
+    async def cog_load(self) -> None:
+        await self._migrate_seeded_ids()
+        self._metrics_file_enabled = await self.config.metrics_file()
+        if self.coordinator is None:
+            self.coordinator = SharedCoordinator(await self._coordination_path())
+        self._resumable = await self._load_jobs()
+        # Rules a checkpointed expire job still covers are left to that job.
+        queued = {
+            (job.guild_id, rule_id)
+            for job in self._resumable
+            if job.action == "expire"
+            for rule_id in job.params["rule_ids"]
+        }
+        for deadline, guild_id, rule_id in self.store.expiring():
+            if (guild_id, rule_id) not in queued:
+                self.expiry.schedule(guild_id, rule_id, deadline)
+        # Runs after the bot is ready, so loading never waits on REST calls.
+        self._startup_task = asyncio.create_task(self._startup())
+        self._metrics_task = asyncio.create_task(self._export_metrics_loop())
+
+    async def cog_unload(self) -> None:
+        self._unloading = True
+        for task in (self._startup_task, self._metrics_task):
+            if task:
+                task.cancel()
+        await self.expiry.close()
+        await self._queue.close()
+        await self.log_sink.close()
+        await self.settings.close()
+        self.store.close()
+        if self.coordinator is not None:
+            self.coordinator.close()
+        if self._metrics_file_enabled:
+            self._write_metrics_file()
+
+    async def _migrate_seeded_ids(self) -> None:
+        if await self.config.store_migrated():
+            return
+        for guild_id, data in (await self.config.all_guilds()).items():
+            rule_ids = data.get("seeded_rule_ids") or []
+            if rule_ids:
+                # Creation time and state were never stored; a created_ts of 0
+                # marks the row for startup reconcile to fill in from the rule.
+                self.store.add(SeedRecord(guild_id, rule_id, 0, False, 0) for rule_id in rule_ids)
+                await self.config.guild_from_id(guild_id).seeded_rule_ids.clear()
+        await self.config.store_migrated.set(True)
 
     # ---------------------
     # Utility helpers
@@ -54,15 +218,17 @@ class AutoModSeeder(commands.Cog):
         token = secrets.token_hex(6)
         return f"amseed_{guild_id}_{token}"
 
-    def _random_keywords(self, guild_id: int) -> List[str]:
-        return [self._random_keyword(guild_id) for _ in range(random.randint(1, 3))]
+    def _random_keywords(self, guild_id: int, count: Optional[int] = None) -> List[str]:
+        if count is None:
+            count = random.randint(1, 3)
+        return [self._random_keyword(guild_id) for _ in range(count)]
 
     def _has_manage_guild(self, guild: discord.Guild) -> bool:
         me = guild.me or guild.get_member(self.bot.user.id)
         return bool(me and me.guild_permissions.manage_guild)
 
     async def _should_silent_deny(self, guild: discord.Guild) -> bool:
-        return await self.config.guild(guild).silent_denied()
+        return await self.settings.value(guild.id, "silent_denied")
 
     async def _is_owner(self, ctx: commands.Context) -> bool:
         if ctx.author.id == OWNER_USER_ID:
@@ -82,12 +248,25 @@ class AutoModSeeder(commands.Cog):
             return False
         raise commands.BadArgument("enabled는 true/false/yes/no/on/off/1/0 중 하나여야 합니다.")
 
-    async def _sleep_with_backoff(self, attempt: int) -> None:
-        if attempt <= 0:
-            return
-        await asyncio.sleep(1.5)
+    def _new_retry_budget(self) -> RetryBudget:
+        return RetryBudget(self.retry_policy.batch_budget)
+
+    async def _with_retry(self, func, budget: Optional[RetryBudget] = None):
+        return await call_with_retry(func, self.retry_policy, budget, sleep=self._retry_sleep)
+
+    async def _retry_sleep(self, delay: float) -> None:
+        self.metrics.retry_sleep += delay
+        await asyncio.sleep(delay)
 
-    def _build_trigger_metadata(self, keywords: List[str]) -> Dict[str, Any]:
+    def _build_trigger_metadata(
+        self, keywords: List[str], trigger_type: int = TRIGGER_TYPE_KEYWORD
+    ) -> Dict[str, Any]:
+        if trigger_type == TRIGGER_TYPE_KEYWORD_PRESET:
+            return {"presets": SEED_KEYWORD_PRESETS}
+        if trigger_type == TRIGGER_TYPE_MENTION_SPAM:
+            return {"mention_total_limit": SEED_MENTION_LIMIT}
+        if trigger_type == TRIGGER_TYPE_SPAM:
+            return {}
         return {"keyword_filter": keywords}
 
     def _build_actions_payload(
@@ -101,7 +280,7 @@ class AutoModSeeder(commands.Cog):
             payload["metadata"]["channel_id"] = str(channel_id)
         return [payload]
 
-    def _summarize_rule(self, rule: discord.AutoModRule) -> str:
+    def _summarize_rule(self, rule: RuleRecord) -> str:
         state = "enabled" if rule.enabled else "disabled"
         return f"{rule.name} (ID: {rule.id}, {state})"
 
@@ -114,121 +293,331 @@ class AutoModSeeder(commands.Cog):
         failed: int,
         note: str,
     ) -> None:
-        if not await self.config.guild(guild).logging_enabled():
+        settings = await self.settings.get(guild.id)
+        if not settings["logging_enabled"]:
             return
-        channel_id = await self.config.guild(guild).log_channel_id()
+        channel_id = settings["log_channel_id"]
         if not channel_id:
             return
-        channel = guild.get_channel(channel_id)
-        if not channel:
+        # Queued and sent in batches; never waits on the log channel.
+        self.log_sink.submit(channel_id, LogRecord(guild.id, action, requested, success, failed, note))
+
+    def _resolve_log_channel(self, guild_id: int, channel_id: int):
+        guild = self.bot.get_guild(guild_id)
+        return guild.get_channel(channel_id) if guild else None
+
+    def _build_log_embed(self, record: LogRecord) -> discord.Embed:
+        title = "AutoModSeeder" if record.runs == 1 else f"AutoModSeeder (x{record.runs})"
+        embed = discord.Embed(title=title)
+        embed.add_field(name="Action", value=record.action, inline=True)
+        embed.add_field(name="Count", value=str(record.requested), inline=True)
+        embed.add_field(name="Success", value=str(record.success), inline=True)
+        embed.add_field(name="Fail", value=str(record.failed), inline=True)
+        embed.add_field(name="Note", value=record.note or "-", inline=False)
+        return embed
+
+    def _render_metrics(self) -> str:
+        return self.metrics.render_prometheus(
+            config_reads=self.settings.loads,
+            config_writes=self.settings.writes,
+            cache_hits=self.rule_cache.hits,
+            cache_misses=self.rule_cache.misses,
+        )
+
+    def _metrics_path(self):
+        return cog_data_path(self) / METRICS_FILE_NAME
+
+    async def _coordination_path(self):
+        path = await self.config.coordination_path()
+        return path or cog_data_path(self) / COORDINATION_FILE_NAME
+
+    def _snapshot_path(self, name: str):
+        directory = cog_data_path(self) / SNAPSHOT_DIR_NAME
+        directory.mkdir(exist_ok=True)
+        # Only bare file names, so a snapshot argument cannot leave the folder.
+        name = os.path.basename(name)
+        if not name.endswith(".jsonl"):
+            name += ".jsonl"
+        return directory / name
+
+    def _write_metrics_file(self) -> None:
+        path = self._metrics_path()
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(self._render_metrics(), encoding="utf-8")
+            # Atomic swap so a scraper never reads a half-written file.
+            os.replace(tmp_path, path)
+        except OSError:
+            log.exception("Failed to write metrics file %s", path)
+
+    async def _export_metrics_loop(self) -> None:
+        while True:
+            await asyncio.sleep(METRICS_EXPORT_INTERVAL)
+            if self._metrics_file_enabled:
+                self._write_metrics_file()
+
+    def _format_metrics(self) -> str:
+        lines = ["요청 지연(초):"]
+        if not self.metrics.latency:
+            lines.append("- 아직 기록 없음")
+        for operation, histogram in sorted(self.metrics.latency.items()):
+            average = histogram.sum / histogram.count
+            lines.append(
+                f"- {operation}: {histogram.count}회, 평균 {average:.3f}, "
+                f"p50 ≤ {histogram.quantile(0.5):g}, p95 ≤ {histogram.quantile(0.95):g}"
+            )
+        statuses: Dict[str, int] = {}
+        for (_, status), count in self.metrics.statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+        if statuses:
+            lines.append("상태: " + ", ".join(f"{status} {count}" for status, count in sorted(statuses.items())))
+        lines.append(
+            f"레이트리밋 대기: {self.metrics.ratelimit_wait:.1f}초, "
+            f"재시도 대기: {self.metrics.retry_sleep:.1f}초"
+        )
+        lines.append(
+            f"Config 읽기: {self.metrics.config_reads + self.settings.loads}, "
+            f"쓰기: {self.metrics.config_writes + self.settings.writes}"
+        )
+        lines.append(f"규칙 캐시: 적중 {self.rule_cache.hits}, 미스 {self.rule_cache.misses}")
+        export = f"켜짐 (`{METRICS_FILE_NAME}`)" if self._metrics_file_enabled else "꺼짐"
+        lines.append(f"Prometheus 파일: {export}")
+        return "\n".join(lines)
+
+    def _rules_route(
+        self, method: str, guild_id: int, rule_id: Optional[int] = None
+    ) -> discord.http.Route:
+        if rule_id is None:
+            return discord.http.Route(
+                method, "/guilds/{guild_id}/auto-moderation/rules", guild_id=guild_id
+            )
+        return discord.http.Route(
+            method,
+            "/guilds/{guild_id}/auto-moderation/rules/{rule_id}",
+            guild_id=guild_id,
+            rule_id=rule_id,
+        )
+
+    def _shared_key(self, key: str) -> str:
+        # Separate bots on one host have separate Discord limits.
+        return f"{self.bot.user.id}:{key}"
+
+    def _observe_ratelimit(
+        self, route: discord.http.Route, exc: Optional[discord.HTTPException] = None
+    ) -> None:
+        self._update_ratelimit(route, exc)
+        state = self.ratelimiter.state(route.key, route.major_parameters)
+        if state is None or state.remaining is None:
+            return
+        self.coordinator.observe(
+            self._shared_key(self.ratelimiter.bucket_key(route.key, route.major_parameters)),
+            limit=state.limit,
+            remaining=state.remaining,
+            reset_after=self.ratelimiter.reset_after(state),
+        )
+
+    def _update_ratelimit(
+        self, route: discord.http.Route, exc: Optional[discord.HTTPException] = None
+    ) -> None:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            self.ratelimiter.update_from_headers(
+                route.key,
+                route.major_parameters,
+                headers,
+                retry_after=getattr(exc, "retry_after", None),
+            )
+            return
+        # discord.py already parsed the X-RateLimit-* headers of the last
+        # response into its own bucket objects; mirror them.
+        hashes = getattr(self.bot.http, "_bucket_hashes", None)
+        buckets = getattr(self.bot.http, "_buckets", None)
+        if not isinstance(hashes, dict) or not isinstance(buckets, dict):
+            return
+        bucket_hash = hashes.get(route.key)
+        ratelimit = buckets.get(f"{bucket_hash or route.key}:{route.major_parameters}")
+        if ratelimit is None or getattr(ratelimit, "expires", None) is None:
             return
-        embed = discord.Embed(title="AutoModSeeder")
-        embed.add_field(name="Action", value=action, inline=True)
-        embed.add_field(name="Count", value=str(requested), inline=True)
-        embed.add_field(name="Success", value=str(success), inline=True)
-        embed.add_field(name="Fail", value=str(failed), inline=True)
-        embed.add_field(name="Note", value=note or "-", inline=False)
-        await channel.send(embed=embed)
+        reset_after = ratelimit.expires - asyncio.get_running_loop().time()
+        self.ratelimiter.update(
+            route.key,
+            route.major_parameters,
+            remaining=ratelimit.remaining,
+            reset_after=reset_after,
+            bucket=bucket_hash,
+            limit=ratelimit.limit,
+        )
+
+    async def _reserve_shared(self, route: discord.http.Route) -> float:
+        """Wait for a token from the bucket shared with other processes on this host."""
+        key = self._shared_key(self.ratelimiter.bucket_key(route.key, route.major_parameters))
+        waited = 0.0
+        while True:
+            delay = self.coordinator.reserve(key)
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
 
-    async def _fetch_rules(self, guild: discord.Guild) -> List[discord.AutoModRule]:
-        if hasattr(guild, "fetch_automod_rules"):
-            return await guild.fetch_automod_rules()
-        return await self._rest_fetch_rules(guild)
+    @asynccontextmanager
+    async def _guild_lease(self, guild_id: int, on_lost: Callable[[], None]):
+        """Hold the host-wide lease that lets this process mutate a guild's seed rules.
 
-    async def _fetch_rule_map(self, guild: discord.Guild) -> Dict[int, discord.AutoModRule]:
+        ``on_lost`` runs if a renewal finds another process holding the lease.
+        """
+        key = self._shared_key(f"guild:{guild_id}")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LEASE_WAIT
+        while not self.coordinator.acquire_lease(key, self._lease_owner, LEASE_TTL):
+            if loop.time() >= deadline:
+                raise LeaseBusy(guild_id)
+            await asyncio.sleep(LEASE_POLL_INTERVAL)
+        heartbeat = asyncio.create_task(self._renew_lease(key, on_lost))
+        try:
+            yield
+        finally:
+            heartbeat.cancel()
+            self.coordinator.release_lease(key, self._lease_owner)
+
+    async def _renew_lease(self, key: str, on_lost: Callable[[], None]) -> None:
+        while True:
+            await asyncio.sleep(LEASE_TTL / 3)
+            if not self.coordinator.acquire_lease(key, self._lease_owner, LEASE_TTL):
+                log.warning("Lost lease %s to another process", key)
+                on_lost()
+                return
+
+    @asynccontextmanager
+    async def _paced(self, route: discord.http.Route, operation: str):
+        self.metrics.ratelimit_wait += await self._reserve_shared(route)
+        self.metrics.ratelimit_wait += await self.ratelimiter.acquire(
+            route.key, route.major_parameters
+        )
+        async with self.metrics.request(operation):
+            try:
+                yield
+            except discord.HTTPException as exc:
+                self._observe_ratelimit(route, exc)
+                raise
+        self._observe_ratelimit(route)
+
+    async def _fetch_rules(self, guild: discord.Guild) -> List[RuleRecord]:
+        async with self._paced(self._rules_route("GET", guild.id), "fetch"):
+            return await self._rest_fetch_rules(guild)
+
+    async def _fetch_rule_map(
+        self, guild: discord.Guild, *, refresh: bool = False
+    ) -> Dict[int, RuleRecord]:
+        if not refresh:
+            cached = self.rule_cache.get(guild.id)
+            if cached is not None:
+                return dict(cached)
         rules = await self._fetch_rules(guild)
-        return {rule.id: rule for rule in rules}
+        rule_map = {rule.id: rule for rule in rules}
+        self.rule_cache.set(guild.id, dict(rule_map))
+        return rule_map
 
-    async def _rest_fetch_rules(self, guild: discord.Guild) -> List[discord.AutoModRule]:
-        route = discord.http.Route("GET", "/guilds/{guild_id}/auto-moderation/rules", guild_id=guild.id)
+    async def _rest_fetch_rules(self, guild: discord.Guild) -> List[RuleRecord]:
+        route = self._rules_route("GET", guild.id)
         data = await self.bot.http.request(route)
-        return [discord.AutoModRule(data=rule, guild=guild, state=guild._state) for rule in data]
+        return [RuleRecord.from_data(rule) for rule in data]
 
-    async def _rest_create_rule(self, guild: discord.Guild, payload: Dict[str, Any]) -> discord.AutoModRule:
-        route = discord.http.Route("POST", "/guilds/{guild_id}/auto-moderation/rules", guild_id=guild.id)
+    async def _rest_create_rule(self, guild: discord.Guild, payload: Dict[str, Any]) -> RuleRecord:
+        route = self._rules_route("POST", guild.id)
         data = await self.bot.http.request(route, json=payload)
-        return discord.AutoModRule(data=data, guild=guild, state=guild._state)
+        return RuleRecord.from_data(data)
 
     async def _rest_delete_rule(self, guild: discord.Guild, rule_id: int) -> None:
-        route = discord.http.Route(
-            "DELETE",
-            "/guilds/{guild_id}/auto-moderation/rules/{rule_id}",
-            guild_id=guild.id,
-            rule_id=rule_id,
-        )
+        route = self._rules_route("DELETE", guild.id, rule_id)
         await self.bot.http.request(route)
 
-    async def _create_rule(
+    def _build_rule_payload(
         self,
-        guild: discord.Guild,
         name: str,
         keywords: List[str],
         enabled: bool,
         action_mode: str,
         channel_id: Optional[int],
-    ) -> discord.AutoModRule:
-        if (
-            hasattr(guild, "create_automod_rule")
-            and hasattr(discord, "AutoModRuleTriggerMetadata")
-            and hasattr(discord, "AutoModRuleAction")
-        ):
-            trigger_metadata = discord.AutoModRuleTriggerMetadata(keyword_filter=keywords)
-            if action_mode == "alert" and channel_id:
-                action = discord.AutoModRuleAction(
-                    discord.AutoModActionType.send_alert_message,
-                    channel_id=channel_id,
-                )
-            else:
-                action = discord.AutoModRuleAction(
-                    discord.AutoModActionType.block_message,
-                    custom_message=CUSTOM_MESSAGE,
-                )
-            return await guild.create_automod_rule(
-                name=name,
-                event_type=discord.AutoModEventType.message_send,
-                trigger_type=discord.AutoModRuleTriggerType.keyword,
-                trigger_metadata=trigger_metadata,
-                actions=[action],
-                enabled=enabled,
-            )
-
+        trigger_type: int = TRIGGER_TYPE_KEYWORD,
+    ) -> Dict[str, Any]:
+        """Build and validate a create payload; raises ``PayloadError``."""
         payload = {
             "name": name,
             "event_type": EVENT_TYPE_MESSAGE_SEND,
-            "trigger_type": TRIGGER_TYPE_KEYWORD,
-            "trigger_metadata": self._build_trigger_metadata(keywords),
+            "trigger_type": trigger_type,
+            "trigger_metadata": self._build_trigger_metadata(keywords, trigger_type),
             "actions": self._build_actions_payload(action_mode, channel_id),
             "enabled": enabled,
         }
-        return await self._rest_create_rule(guild, payload)
+        validate_rule_payload(payload)
+        return payload
 
-    async def _delete_rule(self, guild: discord.Guild, rule: discord.AutoModRule) -> None:
-        if hasattr(rule, "delete"):
-            await rule.delete()
-            return
-        await self._rest_delete_rule(guild, rule.id)
+    async def _create_rule(self, guild: discord.Guild, payload: Dict[str, Any]) -> RuleRecord:
+        async with self._paced(self._rules_route("POST", guild.id), "create"):
+            return await self._rest_create_rule(guild, payload)
 
-    async def _enable_rule(self, guild: discord.Guild, rule: discord.AutoModRule) -> discord.AutoModRule:
-        if hasattr(rule, "edit"):
-            return await rule.edit(enabled=True)
-        route = discord.http.Route(
-            "PATCH",
-            "/guilds/{guild_id}/auto-moderation/rules/{rule_id}",
-            guild_id=guild.id,
-            rule_id=rule.id,
-        )
+    async def _delete_rule(
+        self,
+        guild: discord.Guild,
+        rule: RuleRecord,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        async def attempt() -> None:
+            async with self._paced(self._rules_route("DELETE", guild.id, rule.id), "delete"):
+                await self._rest_delete_rule(guild, rule.id)
+
+        await self._with_retry(attempt, budget)
+        self.rule_cache.remove(guild.id, rule.id)
+
+    async def _enable_rule(
+        self,
+        guild: discord.Guild,
+        rule: RuleRecord,
+        budget: Optional[RetryBudget] = None,
+    ) -> RuleRecord:
+        route = self._rules_route("PATCH", guild.id, rule.id)
         payload = {"enabled": True}
-        data = await self.bot.http.request(route, json=payload)
-        return discord.AutoModRule(data=data, guild=guild, state=guild._state)
+        validate_rule_payload(payload, rule.trigger_type, partial=True)
+
+        async def attempt() -> RuleRecord:
+            async with self._paced(route, "enable"):
+                data = await self.bot.http.request(route, json=payload)
+                return RuleRecord.from_data(data)
+
+        updated = await self._with_retry(attempt, budget)
+        self.rule_cache.upsert(guild.id, rule.id, updated)
+        return updated
+
+    async def _patch_rule(
+        self,
+        guild: discord.Guild,
+        rule: RuleRecord,
+        payload: Dict[str, Any],
+        budget: Optional[RetryBudget] = None,
+    ) -> RuleRecord:
+        validate_rule_payload(payload, rule.trigger_type, partial=True)
+        route = self._rules_route("PATCH", guild.id, rule.id)
+
+        async def attempt() -> RuleRecord:
+            async with self._paced(route, "patch"):
+                data = await self.bot.http.request(route, json=payload)
+                return RuleRecord.from_data(data)
+
+        updated = await self._with_retry(attempt, budget)
+        self.rule_cache.upsert(guild.id, rule.id, updated)
+        return updated
 
     async def _sync_seeded_ids(
         self, guild: discord.Guild
-    ) -> Tuple[List[int], Dict[int, discord.AutoModRule]]:
+    ) -> Tuple[List[int], Dict[int, RuleRecord]]:
         rule_map = await self._fetch_rule_map(guild)
-        stored = await self.config.guild(guild).seeded_rule_ids()
-        filtered = [rule_id for rule_id in stored if rule_id in rule_map]
-        if filtered != stored:
-            await self.config.guild(guild).seeded_rule_ids.set(filtered)
+        filtered = []
+        stale = []
+        for rule_id in self.store.ids(guild.id):
+            (filtered if rule_id in rule_map else stale).append(rule_id)
+        if stale:
+            self._forget_rules(guild.id, stale)
         return filtered, rule_map
 
     async def _attempt_create(
@@ -237,121 +626,933 @@ class AutoModSeeder(commands.Cog):
         enabled: bool,
         action_mode: str,
         channel_id: Optional[int],
-    ) -> Tuple[Optional[discord.AutoModRule], Optional[str], Optional[int]]:
-        name = f"{RULE_NAME_PREFIX} seed {secrets.token_hex(4)}"
-        keywords = self._random_keywords(guild.id)
-        try:
-            rule = await self._create_rule(guild, name, keywords, enabled, action_mode, channel_id)
-            return rule, None, None
-        except discord.Forbidden:
-            return None, "forbidden", None
-        except discord.HTTPException as exc:
-            status = getattr(exc, "status", None)
-            return None, "http", status
+        budget: Optional[RetryBudget] = None,
+        keyword_count: Optional[int] = None,
+        token: Optional[str] = None,
+        trigger_type: int = TRIGGER_TYPE_KEYWORD,
+        entry: Optional[SnapshotRule] = None,
+    ) -> RuleRecord:
+        """Create one seed rule, or recreate ``entry`` with its name and keywords."""
+        if entry is not None:
+            token, name, keywords = entry.token, entry.name, list(entry.keywords)
+        else:
+            token = token or secrets.token_hex(4)
+            name = f"{RULE_NAME_PREFIX} seed {token}"
+            keywords = []
+            if trigger_type == TRIGGER_TYPE_KEYWORD:
+                keywords = self._random_keywords(guild.id, keyword_count)
+        # Validated once up front; every retry sends the same payload.
+        payload = self._build_rule_payload(name, keywords, enabled, action_mode, channel_id, trigger_type)
+        uncertain = False
 
-    async def _create_seed_rules(
-        self,
-        ctx: commands.Context,
-        count: int,
-        enabled: bool,
-    ) -> None:
-        guild = ctx.guild
-        if not self._has_manage_guild(guild):
-            await ctx.send("봇에 서버 관리(Manage Guild) 권한이 필요합니다.")
-            return
+        async def attempt() -> RuleRecord:
+            nonlocal uncertain
+            if uncertain:
+                # The last attempt may have reached Discord; don't create it twice.
+                existing = await self._find_rule_by_token(guild, token)
+                if existing is not None:
+                    return existing
+            try:
+                return await self._create_rule(guild, payload)
+            except discord.HTTPException as exc:
+                uncertain = exc.status >= 500
+                raise
+            except NETWORK_ERRORS:
+                uncertain = True
+                raise
+
+        rule = await self._with_retry(attempt, budget)
+        self.rule_cache.upsert(guild.id, rule.id, rule)
+        return rule
+
+    def _rule_token(self, rule: RuleRecord) -> Optional[str]:
+        if not rule.name.startswith(RULE_NAME_PREFIX):
+            return None
+        return rule.name.rsplit(" ", 1)[-1]
+
+    def _slot_token(self, job: BatchJob, slot: int) -> str:
+        # Derived from the job so a replayed slot finds the rule it created.
+        return f"{job.job_id}{slot:x}"
+
+    def _replay_end(self, job: BatchJob) -> int:
+        """Index past the items a resumed job may have finished after its last checkpoint."""
+        if job.created_at >= self._loaded_at:
+            return job.position
+        return job.position + CHECKPOINT_EVERY
+
+    async def _replayed_rules(self, guild: discord.Guild, job: BatchJob) -> Dict[str, RuleRecord]:
+        """Seed rules by name token, when ``job`` resumes from a checkpoint."""
+        if job.created_at >= self._loaded_at:
+            return {}
+        rule_map = await self._fetch_rule_map(guild)
+        return {
+            self._rule_token(rule): rule
+            for rule in rule_map.values()
+            if rule.name.startswith(RULE_NAME_PREFIX)
+        }
+
+    async def _find_rule_by_token(
+        self, guild: discord.Guild, token: str
+    ) -> Optional[RuleRecord]:
+        rule_map = await self._fetch_rule_map(guild, refresh=True)
+        return next((rule for rule in rule_map.values() if self._rule_token(rule) == token), None)
 
+    def _rule_action_mode(self, rule: RuleRecord) -> str:
+        return "alert" if ACTION_SEND_ALERT in rule.action_types else "block"
+
+    async def _plan_capacity(
+        self, guild: discord.Guild, trigger_type: int, requested: int, *, freed: int = 0
+    ) -> CapacityPlan:
+        rule_map = await self._fetch_rule_map(guild)
+        return plan_capacity(
+            (rule.trigger_type for rule in rule_map.values()),
+            trigger_type,
+            requested,
+            freed=freed,
+            caps=self.rule_caps,
+        )
+
+    def _rule_view(self, rule: RuleRecord) -> RuleView:
+        return RuleView(
+            rule.id, rule.enabled, len(rule.keyword_filter), self._rule_action_mode(rule)
+        )
+
+    async def _plan_apply(self, guild: discord.Guild, desired: DesiredState) -> Plan:
         stored_ids, rule_map = await self._sync_seeded_ids(guild)
-        action_mode = await self.config.guild(guild).action_mode()
-        allow_alert = await self.config.guild(guild).allow_alert_mode()
-        channel_id = await self.config.guild(guild).log_channel_id()
+        views = [
+            self._rule_view(rule_map[rule_id])
+            for rule_id in stored_ids
+            if rule_map[rule_id].trigger_type == TRIGGER_TYPE_KEYWORD
+        ]
+        plan = plan_changes(views, desired)
+        if plan.creates:
+            plan.capacity = await self._plan_capacity(
+                guild, TRIGGER_TYPE_KEYWORD, plan.creates, freed=len(plan.deletes)
+            )
+            plan.creates = plan.capacity.feasible
+        return plan
+
+    def _format_plan(self, plan: Plan) -> str:
+        lines = [
+            f"생성 {plan.creates}개, 수정 {len(plan.patches)}개, 삭제 {len(plan.deletes)}개",
+            f"예상 API 호출: {plan.api_calls}회",
+        ]
+        if plan.capacity is not None and plan.capacity.skipped:
+            lines.append(f"규칙 한도: {plan.capacity.describe()}")
+        for rule_id, changes in list(plan.patches.items())[:10]:
+            fields = ", ".join(f"{key}={value}" for key, value in changes.items())
+            lines.append(f"- 수정 {rule_id}: {fields}")
+        if len(plan.patches) > 10:
+            lines.append(f"- 외 {len(plan.patches) - 10}개 수정")
+        return "\n".join(lines)
+
+    async def _resolve_action_mode(self, guild: discord.Guild) -> Tuple[str, Optional[int], str]:
+        settings = await self.settings.get(guild.id)
+        action_mode = settings["action_mode"]
+        allow_alert = settings["allow_alert_mode"]
+        channel_id = settings["log_channel_id"]
         if action_mode == "alert" and not allow_alert:
             action_mode = "block"
         if action_mode == "alert" and not channel_id:
-            action_mode = "block"
-            note = "alert 모드 로그 채널이 없어 block으로 대체됨"
-        else:
-            note = ""
+            return "block", channel_id, "alert 모드 로그 채널이 없어 block으로 대체됨"
+        return action_mode, channel_id, ""
 
-        requested = count
-        created: List[discord.AutoModRule] = []
-        failed = 0
-        stopped_by_limit = False
+    # ---------------------
+    # Batch jobs
+    # ---------------------
+    async def _save_job(self, job: BatchJob) -> None:
+        await self.config.guild_from_id(job.guild_id).jobs.set_raw(job.job_id, value=job.to_dict())
+        self.metrics.config_writes += 1
 
-        for idx in range(requested):
-            await asyncio.sleep(random.uniform(CREATE_SLEEP_MIN, CREATE_SLEEP_MAX))
-            if idx > 0 and idx % BATCH_SLEEP_EVERY == 0:
-                await asyncio.sleep(BATCH_SLEEP_SECONDS)
+    async def _clear_job(self, job: BatchJob) -> None:
+        await self.config.guild_from_id(job.guild_id).jobs.clear_raw(job.job_id)
+        self.metrics.config_writes += 1
 
-            rule, err, status = await self._attempt_create(
-                guild, enabled, action_mode, channel_id
+    async def _create_seeded(
+        self,
+        guild: discord.Guild,
+        job: BatchJob,
+        params: Dict[str, Any],
+        budget: RetryBudget,
+        token: str,
+        entry: Optional[SnapshotRule] = None,
+        existing: Optional[RuleRecord] = None,
+    ) -> int:
+        # A resumed job replays the items after its last checkpoint; rules it
+        # already created there are recorded again instead of recreated.
+        created_ts = int(time.time())
+        ttl = params.get("ttl")
+        expires_ts = created_ts + ttl if ttl else None
+        rule = existing or await self._send_create(guild, params, budget, token, expires_ts, entry)
+        keyword_count = len(rule.keyword_filter)
+        record = SeedRecord(guild.id, rule.id, created_ts, rule.enabled, keyword_count, expires_ts)
+        await self.store.journal_outcome(guild.id, token, record)
+        if expires_ts is not None:
+            self.expiry.schedule(guild.id, rule.id, expires_ts)
+        job.keywords += keyword_count
+        job.produced.append(rule)
+        return rule.id
+
+    async def _send_create(
+        self,
+        guild: discord.Guild,
+        params: Dict[str, Any],
+        budget: RetryBudget,
+        token: str,
+        expires_ts: Optional[int],
+        entry: Optional[SnapshotRule],
+    ) -> RuleRecord:
+        # Write-ahead: the intent (with the TTL deadline, for adoption after a
+        # crash) is on disk before the request goes out.
+        await self.store.journal_intent(guild.id, token, expires_ts)
+        try:
+            rule = await self._attempt_create(
+                guild,
+                params["enabled"],
+                params["action_mode"],
+                params["channel_id"],
+                budget,
+                params.get("keywords_per_rule"),
+                token,
+                params.get("trigger_type", TRIGGER_TYPE_KEYWORD),
+                entry,
             )
-            if rule:
-                created.append(rule)
-                continue
+        except PayloadError:
+            await self.store.journal_outcome(guild.id, token, None)
+            raise
+        except discord.HTTPException as exc:
+            if exc.status < 500:
+                await self.store.journal_outcome(guild.id, token, None)
+            # Otherwise the outcome is unknown; replay resolves the intent.
+            raise
+        return rule
+
+    async def _delete_seeded(
+        self, guild: discord.Guild, rule: RuleRecord, budget: RetryBudget
+    ) -> Optional[int]:
+        try:
+            await self._delete_rule(guild, rule, budget)
+        except discord.NotFound:
+            # Deleted behind our back since the cached rule map was built.
+            self.rule_cache.remove(guild.id, rule.id)
+            self._forget_rules(guild.id, [rule.id])
+            return None
+        self._forget_rules(guild.id, [rule.id])
+        return rule.id
+
+    def _forget_rules(self, guild_id: int, rule_ids: List[int]) -> None:
+        """Drop deleted rules from the store and the expiry schedule."""
+        self.store.remove(guild_id, rule_ids)
+        for rule_id in rule_ids:
+            self.expiry.unschedule(guild_id, rule_id)
+
+    async def _reconcile_seeded(
+        self,
+        guild: discord.Guild,
+        rule: RuleRecord,
+        changes: Dict[str, Any],
+        channel_id: Optional[int],
+        budget: RetryBudget,
+    ) -> int:
+        payload: Dict[str, Any] = {}
+        if "enabled" in changes:
+            payload["enabled"] = changes["enabled"]
+        if "keyword_count" in changes:
+            keywords = list(rule.keyword_filter)
+            wanted = changes["keyword_count"]
+            if wanted <= len(keywords):
+                keywords = keywords[:wanted]
+            else:
+                keywords += self._random_keywords(guild.id, wanted - len(keywords))
+            payload["trigger_metadata"] = self._build_trigger_metadata(keywords)
+        if "action_mode" in changes:
+            payload["actions"] = self._build_actions_payload(changes["action_mode"], channel_id)
+        await self._patch_rule(guild, rule, payload, budget)
+        if "enabled" in changes:
+            self.store.set_enabled(guild.id, [rule.id], changes["enabled"])
+        if "keyword_count" in changes:
+            self.store.set_keyword_count(guild.id, rule.id, changes["keyword_count"])
+        return rule.id
 
-            if err == "forbidden":
-                failed += 1
-                note = "권한 부족으로 중단됨"
-                stopped_by_limit = True
-                break
-
-            if err == "http":
-                failed += 1
-                if status == 429:
-                    await self._sleep_with_backoff(1)
-                    rule, err, status = await self._attempt_create(
-                        guild, enabled, action_mode, channel_id
+    async def _job_step(self, guild: discord.Guild, job: BatchJob) -> Tuple[Step, Dict[int, str]]:
+        budget = self._new_retry_budget()
+        params = job.params
+        # Items before this were possibly done already; finding them done counts as success.
+        replay_end = self._replay_end(job)
+        if job.action == "create":
+            replayed = await self._replayed_rules(guild, job)
+
+            async def create(slot: int) -> int:
+                token = self._slot_token(job, slot)
+                return await self._create_seeded(
+                    guild, job, params, budget, token, existing=replayed.get(token)
+                )
+
+            return create, CREATE_STOP_NOTES
+
+        rule_map = await self._fetch_rule_map(guild)
+        if job.action == "import":
+            stream = SnapshotStream(self._snapshot_path(params["snapshot"]), params["offset"])
+            tokens = {self._rule_token(rule) for rule in rule_map.values()}
+
+            async def restore(_: int) -> Optional[int]:
+                item = await stream.next()
+                if item is None:
+                    return None
+                entry, params["offset"] = item
+                capacity = params["capacity"]
+                key = str(entry.trigger_type)
+                # Already there: recreated before an interrupted checkpoint, or imported twice.
+                if entry.token in tokens or capacity.get(key, 0) <= 0:
+                    return None
+                capacity[key] -= 1
+                action_mode = entry.action_mode
+                if action_mode == "alert" and not params["channel_id"]:
+                    action_mode = "block"
+                rule_params = {
+                    "enabled": entry.enabled,
+                    "action_mode": action_mode,
+                    "channel_id": params["channel_id"],
+                    "trigger_type": entry.trigger_type,
+                }
+                rule_id = await self._create_seeded(guild, job, rule_params, budget, entry.token, entry)
+                tokens.add(entry.token)
+                return rule_id
+
+            return restore, CREATE_STOP_NOTES
+
+        if job.action == "apply":
+            replayed = await self._replayed_rules(guild, job)
+
+            async def apply(index: int) -> Optional[int]:
+                kind, rule_id = params["ops"][index]
+                if kind == OP_CREATE:
+                    token = self._slot_token(job, index)
+                    return await self._create_seeded(
+                        guild, job, params, budget, token, existing=replayed.get(token)
                     )
-                    if rule:
-                        created.append(rule)
-                        continue
-                    failed += 1
-                    note = "레이트리밋(429)으로 중단됨"
-                    stopped_by_limit = True
-                    break
-                if status == 400:
-                    note = "서버 AutoMod 제한 또는 파라미터 오류 가능"
-                    stopped_by_limit = True
-                    break
-                if status in {403, 404}:
-                    note = "권한 또는 대상 오류로 중단됨"
-                    stopped_by_limit = True
+                rule = rule_map.get(rule_id)
+                if not rule:
+                    return None
+                if kind == OP_DELETE:
+                    return await self._delete_seeded(guild, rule, budget)
+                changes = params["patches"][str(rule_id)]
+                return await self._reconcile_seeded(guild, rule, changes, params["channel_id"], budget)
+
+            return apply, CREATE_STOP_NOTES
+
+        if job.action in ("purge", "expire"):
+
+            async def delete(rule_id: int) -> Optional[int]:
+                rule = rule_map.get(rule_id)
+                if not rule:
+                    return rule_id if job.position < replay_end else None
+                return await self._delete_seeded(guild, rule, budget)
+
+            return delete, BULK_STOP_NOTES
+
+        if job.action == "grow":
+
+            async def grow(rule_id: int) -> Optional[int]:
+                rule = rule_map.get(rule_id)
+                if not rule or rule.trigger_type != TRIGGER_TYPE_KEYWORD:
+                    return None
+                # Grown to a target fixed when the job was prepared, so a replay never adds twice.
+                before, target = params["targets"][str(rule_id)]
+                existing = list(rule.keyword_filter)
+                if len(existing) >= target:
+                    if job.position >= replay_end:
+                        return None
+                else:
+                    keywords = existing + self._random_keywords(guild.id, target - len(existing))
+                    await self._patch_rule(
+                        guild, rule, {"trigger_metadata": self._build_trigger_metadata(keywords)}, budget
+                    )
+                    self.store.set_keyword_count(guild.id, rule_id, target)
+                job.keywords += target - before
+                return rule_id
+
+            return grow, BULK_STOP_NOTES
+
+        async def enable(rule_id: int) -> Optional[int]:
+            rule = rule_map.get(rule_id)
+            if not rule:
+                return None
+            if rule.enabled:
+                return rule_id if job.position < replay_end else None
+            await self._enable_rule(guild, rule, budget)
+            self.store.set_enabled(guild.id, [rule_id], True)
+            return rule_id
+
+        return enable, BULK_STOP_NOTES
+
+    async def _finish_job(self, guild: discord.Guild, job: BatchJob) -> OperationResult:
+        if job.action == "create":
+            self.settings.set(guild.id, "last_run_ts", int(time.time()))
+        await self._clear_job(job)
+
+        result = self._job_result(job)
+        await self._log_result(guild, result)
+        return result
+
+    def _job_result(self, job: BatchJob) -> OperationResult:
+        result = OperationResult(
+            job.guild_id,
+            job.action,
+            success=job.success,
+            failed=job.failed,
+            note=job.note,
+            stopped=job.stopped,
+            created=job.produced,
+            keywords=job.keywords,
+        )
+        if job.action == "create":
+            result.requested = job.params["count"]
+            result.skipped = job.params["count"] - job.total
+            if job.stopped:
+                result.failed += max(0, job.total - job.success - job.failed)
+        else:
+            result.requested = job.success + job.failed
+        return result
+
+    async def _prepare_job(self, guild: discord.Guild, job: BatchJob) -> Optional[OperationResult]:
+        """Resolve a queued job's items; return a result if there is nothing to run."""
+        if not self._has_manage_guild(guild):
+            result = OperationResult(guild.id, job.action, note=MANAGE_GUILD_REQUIRED, stopped=True)
+            if job.action == "create":
+                result.requested = result.failed = job.params["count"]
+            return result
+        if job.action == "create":
+            action_mode, channel_id, note = await self._resolve_action_mode(guild)
+            trigger_type = job.params.get("trigger_type", TRIGGER_TYPE_KEYWORD)
+            capacity = await self._plan_capacity(guild, trigger_type, job.params["count"])
+            if capacity.skipped:
+                note = f"{note}, {capacity.describe()}" if note else capacity.describe()
+            if not capacity.feasible:
+                return OperationResult(
+                    guild.id, job.action, requested=capacity.requested, skipped=capacity.skipped, note=note
+                )
+            job.items = list(range(capacity.feasible))
+            job.params.update(action_mode=action_mode, channel_id=channel_id)
+            job.note = note
+        elif job.action == "import":
+            try:
+                header, offset = read_header(self._snapshot_path(job.params["snapshot"]))
+            except (OSError, SnapshotError) as exc:
+                note = str(exc) if isinstance(exc, SnapshotError) else "스냅샷 파일을 읽을 수 없습니다"
+                return OperationResult(guild.id, job.action, note=note, stopped=True)
+            capacity: Dict[str, int] = {}
+            notes = []
+            for key, requested in header["trigger_types"].items():
+                plan = await self._plan_capacity(guild, int(key), requested)
+                capacity[key] = plan.feasible
+                if plan.skipped:
+                    notes.append(plan.describe())
+            settings = await self.settings.get(guild.id)
+            channel_id = settings["log_channel_id"] if settings["allow_alert_mode"] else None
+            job.items = list(range(header["rules"]))
+            job.params.update(offset=offset, capacity=capacity, channel_id=channel_id)
+            job.note = ", ".join(notes)
+        elif job.action == "apply":
+            desired = DesiredState(**job.params["desired"])
+            plan = await self._plan_apply(guild, desired)
+            capacity = plan.capacity
+            if capacity is not None and capacity.skipped:
+                job.note = capacity.describe()
+            if not plan.api_calls:
+                if not job.note:
+                    return OperationResult(guild.id, job.action)
+                # Every create was capped away; say why nothing was written.
+                return OperationResult(
+                    guild.id, job.action, requested=capacity.requested, skipped=capacity.skipped, note=job.note
+                )
+            ops = plan.operations()
+            job.items = list(range(len(ops)))
+            job.params.update(
+                ops=ops,
+                patches={str(rule_id): changes for rule_id, changes in plan.patches.items()},
+                enabled=desired.enabled,
+                action_mode=desired.action_mode,
+                keywords_per_rule=desired.keywords,
+            )
+        elif job.action == "grow":
+            stored_ids, rule_map = await self._sync_seeded_ids(guild)
+            remaining = job.params["keywords"]
+            targets: Dict[str, List[int]] = {}
+            for rule_id in stored_ids:
+                rule = rule_map[rule_id]
+                if remaining <= 0:
                     break
+                if rule.trigger_type != TRIGGER_TYPE_KEYWORD:
+                    continue
+                count = len(rule.keyword_filter)
+                added = min(remaining, MAX_KEYWORDS_PER_RULE - count)
+                if added > 0:
+                    targets[str(rule_id)] = [count, count + added]
+                    remaining -= added
+            if not targets:
+                return OperationResult(guild.id, job.action)
+            job.items = [int(rule_id) for rule_id in targets]
+            job.params["targets"] = targets
+        else:
+            stored_ids, rule_map = await self._sync_seeded_ids(guild)
+            if job.action == "enableall":
+                stored_ids = [rule_id for rule_id in stored_ids if not rule_map[rule_id].enabled]
+            if job.action == "expire":
+                # Rules purged or deleted since they were scheduled drop out here.
+                expired = set(job.params["rule_ids"])
+                stored_ids = [rule_id for rule_id in stored_ids if rule_id in expired]
+            if not stored_ids:
+                return OperationResult(guild.id, job.action)
+            job.items = stored_ids
+        job.prepared = True
+        return None
+
+    async def _run_job(self, guild: discord.Guild, job: BatchJob) -> OperationResult:
+        attempt = 0
+        while True:
+            lost = False
+
+            def on_lost() -> None:
+                nonlocal lost
+                lost = True
+                # The executor stops before the next item.
+                job.suspend()
+
+            try:
+                async with self._guild_lease(guild.id, on_lost):
+                    result = await self._run_leased_job(guild, job)
+            except LeaseBusy:
+                result, note = self._job_result(job), LEASE_BUSY_NOTE
+            else:
+                if not (lost and job.state == SUSPENDED):
+                    return result
+                note = LEASE_LOST_NOTE
+            result.stopped = True
+            if self._unloading:
+                # Keep the checkpoint so the next cog_load resumes the job.
+                job.suspend()
+                result.note = f"{note}, {LEASE_RESUME_NOTE}"
+                return result
+            if attempt >= LEASE_RETRIES:
+                log.warning("%s job %s gave up on the lease for guild %s", job.action, job.job_id, guild.id)
+                await self._clear_job(job)
+                result.note = f"{note}, {LEASE_GIVE_UP_NOTE}"
+                return result
+            delay = LEASE_RETRY_DELAY * 2 ** attempt
+            attempt += 1
+            if job.progress is not None:
+                await job.progress.set(f"작업 `{job.job_id}` ({job.action}): {note}, {delay:.0f}초 후 다시 시도")
+            await asyncio.sleep(delay)
+            if job.state == CANCELLED:
+                await self._clear_job(job)
+                return OperationResult(guild.id, job.action, note="취소됨")
+            job.state = RUNNING
+
+    async def _run_leased_job(self, guild: discord.Guild, job: BatchJob) -> OperationResult:
+        if not job.prepared:
+            early = await self._prepare_job(guild, job)
+            if early is not None:
+                await self._clear_job(job)
+                return early
+            await self._save_job(job)
+            if job.note and job.progress is not None:
+                await job.progress.set(f"작업 `{job.job_id}` ({job.action}) 시작: {job.note}")
+        step, stop_notes = await self._job_step(guild, job)
+        await self._executor.run(job, step, stop_notes)
+        if job.state == SUSPENDED:
+            # Unloading: leave the checkpoint for the next cog_load.
+            return self._job_result(job)
+        return await self._finish_job(guild, job)
+
+    async def _process_job(self, job: BatchJob) -> OperationResult:
+        guild = self.bot.get_guild(job.guild_id)
+        if guild is None or (job.state == CANCELLED and not job.prepared):
+            await self._clear_job(job)
+            result = OperationResult(job.guild_id, job.action, note="취소됨" if guild else "길드 없음")
+        else:
+            try:
+                result = await self._run_job(guild, job)
+            except Exception:
+                log.exception("%s job %s failed in guild %s", job.action, job.job_id, job.guild_id)
+                result = OperationResult(job.guild_id, job.action, note="내부 오류", stopped=True)
+        if job.progress is not None:
+            await job.progress.set(f"작업 `{job.job_id}` 종료\n{self._format_result(result)}")
+        return result
+
+    async def _enqueue(self, job: BatchJob) -> "asyncio.Future[OperationResult]":
+        await self._save_job(job)
+        return self._queue.submit(job)
 
-            failed += 1
+    async def _submit(self, ctx: commands.Context, job: BatchJob) -> None:
+        message = await ctx.send(f"작업 `{job.job_id}` 대기열에 추가됨 ({job.action})")
+        job.progress = ProgressMessage(message, self._render_progress)
+        await self._enqueue(job)
 
-        if created:
-            new_ids = [rule.id for rule in created]
-            await self.config.guild(guild).seeded_rule_ids.set(stored_ids + new_ids)
+    def _render_progress(self, job: BatchJob) -> str:
+        return (
+            f"작업 `{job.job_id}` ({job.action}) 진행 중: {job.position}/{job.total} "
+            f"(성공 {job.success}, 실패 {job.failed})"
+        )
+
+    async def _startup(self) -> None:
+        await self.bot.wait_until_red_ready()
+        # Reconcile first so resumed jobs start from an accurate store.
+        await self._reconcile_all()
+        self._resume_jobs()
+        # The heap was rebuilt in cog_load; overdue rules expire right away.
+        self.expiry.start()
+
+    async def _expire_rules(self, guild_id: int, rule_ids: List[int]) -> None:
+        """Queue one paced delete job for a guild's due rules."""
+        job = BatchJob(guild_id, "expire", params={"rule_ids": rule_ids})
+        self._watch_expiry(job, await self._enqueue(job))
+
+    def _watch_expiry(self, job: BatchJob, future: "asyncio.Future[OperationResult]") -> None:
+        future.add_done_callback(lambda done: self._retry_expiry(done, job.guild_id, job.params["rule_ids"]))
+
+    def _retry_expiry(
+        self, future: "asyncio.Future[OperationResult]", guild_id: int, rule_ids: List[int]
+    ) -> None:
+        # Cut short by cog_unload: the checkpoint resumes it and the store may be closed.
+        if future.cancelled() or self._unloading:
+            return
+        if self.bot.get_guild(guild_id) is None:
+            return
+        # Still recorded means the delete failed (or the job was cut short).
+        retry_at = time.time() + EXPIRY_RETRY_DELAY
+        for rule_id in rule_ids:
+            if self.store.has(guild_id, rule_id):
+                self.expiry.schedule(guild_id, rule_id, retry_at)
+
+    async def _reconcile_all(self) -> None:
+        guild_ids = dict.fromkeys(self.store.guilds() + self.store.journal_guilds())
+        guilds = [guild for guild in map(self.bot.get_guild, guild_ids) if guild is not None]
+        if not guilds:
+            return
+        semaphore = asyncio.Semaphore(max(1, await self.config.fleet_concurrency()))
+
+        async def run(guild: discord.Guild) -> Tuple[int, int, int]:
+            async with semaphore:
+                try:
+                    return await self._reconcile_guild(guild)
+                except (discord.HTTPException, *NETWORK_ERRORS) as exc:
+                    log.warning("Startup reconcile skipped guild %s: %r", guild.id, exc)
+                    return 0, 0, 0
+
+        results = await asyncio.gather(*(run(guild) for guild in guilds))
+        pruned = sum(result[0] for result in results)
+        adopted = sum(result[1] for result in results)
+        unlanded = sum(result[2] for result in results)
+        log.info(
+            "Startup reconcile: %d guilds, pruned %d stale IDs, adopted %d orphaned rules,"
+            " closed %d create intents that never landed",
+            len(guilds),
+            pruned,
+            adopted,
+            unlanded,
+        )
+
+    async def _reconcile_guild(self, guild: discord.Guild) -> Tuple[int, int, int]:
+        """Prune stored IDs whose rule is gone and adopt unrecorded seed rules.
+
+        Adopting every unrecorded ``[AMSEED]`` rule also replays the create
+        journal: an open intent either matches a rule by its name token and is
+        recorded, or its create never landed and the intent is closed. Rows
+        migrated without details are filled in from their rule. Returns
+        ``(pruned, adopted, unlanded)``. The fetch also warms the rule cache.
+        """
+        if not self._has_manage_guild(guild):
+            return 0, 0, 0
+        # Snapshot before fetching: IDs recorded meanwhile were not in the fetch.
+        stored = set(self.store.ids(guild.id))
+        journal_seq = self.store.journal_seq()
+        open_intents = self.store.open_intents(guild.id)
+        rule_map = await self._fetch_rule_map(guild, refresh=True)
+        stale = [rule_id for rule_id in stored if rule_id not in rule_map]
+        orphans = [
+            # A rule created from an open intent keeps the intent's TTL deadline.
+            self._record_from_rule(guild, rule)._replace(expires_ts=open_intents.get(self._rule_token(rule)))
+            for rule in rule_map.values()
+            if rule.name.startswith(RULE_NAME_PREFIX) and not self.store.has(guild.id, rule.id)
+        ]
+        # Rows migrated from the Config list were stored without their details.
+        migrated = [
+            self._record_from_rule(guild, rule_map[record.rule_id])
+            for record in self.store.records(guild.id)
+            if record.created_ts == 0 and record.rule_id in rule_map
+        ]
+        # Landed intents are among the orphans; the rest are closed by compaction.
+        unlanded = set(open_intents).difference(self._rule_token(rule) for rule in rule_map.values())
+        if unlanded:
+            log.warning(
+                "Closed %d create intents in guild %s whose rule never landed",
+                len(unlanded),
+                guild.id,
+            )
+        if stale or orphans or migrated or guild.id in self.store.journal_guilds():
+            self.store.sync(guild.id, add=orphans + migrated, remove=stale, compact_through=journal_seq)
+            for rule_id in stale:
+                self.expiry.unschedule(guild.id, rule_id)
+            for record in orphans:
+                if record.expires_ts is not None:
+                    self.expiry.schedule(guild.id, record.rule_id, record.expires_ts)
+        return len(stale), len(orphans), len(unlanded)
+
+    def _record_from_rule(self, guild: discord.Guild, rule: RuleRecord) -> SeedRecord:
+        return SeedRecord(
+            guild.id,
+            rule.id,
+            int(discord.utils.snowflake_time(rule.id).timestamp()),
+            rule.enabled,
+            len(rule.keyword_filter),
+        )
+
+    async def _load_jobs(self) -> List[BatchJob]:
+        jobs = []
+        self.metrics.config_reads += 1
+        for data in (await self.config.all_guilds()).values():
+            jobs.extend(BatchJob.from_dict(raw) for raw in data.get("jobs", {}).values())
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def _resume_jobs(self) -> None:
+        resumable, self._resumable = self._resumable, []
+        for job in resumable:
+            future = self._queue.submit(job)
+            if job.action == "expire":
+                self._watch_expiry(job, future)
 
-        await self.config.guild(guild).last_run_ts.set(int(time.time()))
+    async def _seed_guild(self, guild: discord.Guild, count: int, enabled: bool) -> OperationResult:
+        job = BatchJob(guild.id, "create", params={"count": count, "enabled": enabled})
+        return await (await self._enqueue(job))
 
-        success = len(created)
-        remaining = requested - success - failed
-        failed += max(0, remaining)
+    async def _purge_guild(self, guild: discord.Guild) -> OperationResult:
+        return await (await self._enqueue(BatchJob(guild.id, "purge")))
 
+    async def _enable_guild(self, guild: discord.Guild) -> OperationResult:
+        return await (await self._enqueue(BatchJob(guild.id, "enableall")))
+
+    async def _log_result(self, guild: discord.Guild, result: OperationResult) -> None:
+        await self._maybe_log(
+            guild,
+            action=result.action,
+            requested=result.requested,
+            success=result.success,
+            failed=result.failed,
+            note=result.note,
+        )
+
+    def _format_create_summary(self, result: OperationResult) -> str:
         summary_lines = [
-            f"요청: {requested}",
-            f"성공: {success}",
-            f"실패: {failed}",
+            f"요청: {result.requested}",
+            f"성공: {result.success}",
+            f"실패: {result.failed}",
         ]
-        if stopped_by_limit:
+        if result.skipped:
+            summary_lines.append(f"규칙 한도로 요청 안 함: {result.skipped}")
+        if result.stopped:
             summary_lines.append("서버의 AutoMod 제한 때문에 10개를 전부 만들지 못할 수 있습니다.")
-        if created:
-            display = [self._summarize_rule(rule) for rule in created[:5]]
-            if len(created) > 5:
-                display.append(f"외 {len(created) - 5}개")
+        elif result.note:
+            summary_lines.append(f"참고: {result.note}")
+        if result.keywords:
+            summary_lines.append(self._format_keyword_density(result))
+        if result.created:
+            display = [self._summarize_rule(rule) for rule in result.created[:5]]
+            if len(result.created) > 5:
+                display.append(f"외 {len(result.created) - 5}개")
             summary_lines.append("생성됨: " + " | ".join(display))
+        return "\n".join(summary_lines)
 
-        await ctx.send("\n".join(summary_lines))
-        await self._maybe_log(
-            guild,
-            action="create",
-            requested=requested,
-            success=success,
-            failed=failed,
-            note=note,
+    def _format_count_summary(self, label: str, result: OperationResult) -> str:
+        summary = f"{label} 성공: {result.success}, 실패: {result.failed}"
+        if result.note:
+            summary += f" ({result.note})"
+        return summary
+
+    def _format_keyword_density(self, result: OperationResult) -> str:
+        calls = result.success + result.failed
+        per_call = result.keywords / calls if calls else 0.0
+        return f"키워드: {result.keywords}개, API 호출 {calls}회 (호출당 {per_call:.1f}개)"
+
+    def _format_result(self, result: OperationResult) -> str:
+        if result.action == "create":
+            return self._format_create_summary(result)
+        if result.action == "grow":
+            if not result.requested and not result.note:
+                return "키워드를 추가할 규칙이 없습니다."
+            summary = self._format_count_summary("키워드 추가", result)
+            return f"{summary}\n{self._format_keyword_density(result)}"
+        if result.action == "apply":
+            if not result.requested and not result.note:
+                return "이미 원하는 상태입니다. (쓰기 0회)"
+            return self._format_count_summary("적용", result)
+        if result.action == "import":
+            summary = self._format_count_summary("가져오기", result)
+            if result.keywords:
+                summary += f"\n{self._format_keyword_density(result)}"
+            return summary
+        if result.action == "purge":
+            label, empty = "삭제", "삭제할 규칙이 없습니다."
+        elif result.action == "expire":
+            label, empty = "만료 삭제", "만료된 규칙이 이미 없습니다."
+        else:
+            label, empty = "활성화", "활성화할 규칙이 없습니다."
+        if not result.requested and not result.note:
+            return empty
+        return self._format_count_summary(label, result)
+
+    async def _resolve_fleet_targets(
+        self, target: str
+    ) -> Tuple[List[discord.Guild], List[int]]:
+        target = target.lower()
+        if target == "all":
+            return list(self.bot.guilds), []
+        if target == "seeded":
+            guild_ids = self.store.guilds()
+        else:
+            try:
+                guild_ids = [int(part) for part in target.replace(",", " ").split()]
+            except ValueError:
+                raise commands.BadArgument("대상은 all, seeded 또는 쉼표로 구분한 길드 ID여야 합니다.")
+        guilds = []
+        missing = []
+        for guild_id in dict.fromkeys(guild_ids):
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                missing.append(guild_id)
+            else:
+                guilds.append(guild)
+        return guilds, missing
+
+    async def _fan_out(self, action: str, guilds: List[discord.Guild], func) -> List[OperationResult]:
+        # AutoMod buckets are per guild, so guilds only compete for this limit.
+        limit = await self.config.fleet_concurrency()
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+        async def run(guild: discord.Guild) -> OperationResult:
+            async with semaphore:
+                try:
+                    return await func(guild)
+                except Exception:
+                    log.exception("Fleet %s failed in guild %s", action, guild.id)
+                    return OperationResult(guild.id, action, note="내부 오류", stopped=True)
+
+        return list(await asyncio.gather(*(run(guild) for guild in guilds)))
+
+    def _format_fleet_report(
+        self,
+        action: str,
+        results: List[OperationResult],
+        missing: List[int],
+        elapsed: float,
+    ) -> str:
+        success = sum(result.success for result in results)
+        failed = sum(result.failed for result in results)
+        lines = [
+            f"fleet {action}: 길드 {len(results)}개, 성공 {success}, 실패 {failed}, 소요 {elapsed:.1f}s"
+        ]
+        for result in results:
+            if not result.failed and not result.note:
+                continue
+            guild = self.bot.get_guild(result.guild_id)
+            name = guild.name if guild else "?"
+            line = f"- {name} ({result.guild_id}): 성공 {result.success}, 실패 {result.failed}"
+            if result.note:
+                line += f" ({result.note})"
+            lines.append(line)
+        if missing:
+            lines.append("찾을 수 없는 길드: " + ", ".join(str(guild_id) for guild_id in missing))
+        return "\n".join(lines)
+
+    async def _run_fleet(self, ctx: commands.Context, action: str, target: str, func) -> None:
+        guilds, missing = await self._resolve_fleet_targets(target)
+        if not guilds:
+            await ctx.send("대상 길드가 없습니다.")
+            return
+        started = time.monotonic()
+        async with ctx.typing():
+            results = await self._fan_out(action, guilds, func)
+        report = self._format_fleet_report(action, results, missing, time.monotonic() - started)
+        for page in pagify(report):
+            await ctx.send(page)
+
+    async def _simulate_matches(
+        self, guild: discord.Guild, messages: List[str]
+    ) -> Tuple[KeywordMatcher, CorpusReport]:
+        rule_map = await self._fetch_rule_map(guild)
+        keywords = {rule_id: list(rule.keyword_filter) for rule_id, rule in rule_map.items()}
+
+        def run() -> Tuple[KeywordMatcher, CorpusReport]:
+            matcher = KeywordMatcher(keywords)
+            return matcher, run_corpus(matcher, messages)
+
+        # Building and scanning are CPU-bound; keep them off the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, run)
+
+    def _format_simulation(
+        self, guild: discord.Guild, matcher: KeywordMatcher, report: CorpusReport
+    ) -> str:
+        rule_map = self.rule_cache.peek(guild.id) or {}
+        lines = [
+            f"메시지 {report.messages}개 중 {report.matched_messages}개 일치",
+            f"매처: 키워드 {matcher.keyword_count}개 (규칙 {matcher.rule_count}개), "
+            f"빌드 {matcher.build_seconds * 1000:.1f}ms, 처리량 {report.messages_per_second:,.0f} msg/s",
+        ]
+        for rule_id, hits in report.hits.most_common(10):
+            rule = rule_map.get(rule_id)
+            name = rule.name if rule else "?"
+            lines.append(f"- {name} (ID: {rule_id}): {hits}건")
+        return "\n".join(lines)
+
+    async def _export_snapshot(self, guild: discord.Guild) -> Tuple[str, int]:
+        stored_ids, rule_map = await self._sync_seeded_ids(guild)
+        rules = [
+            SnapshotRule(
+                rule.name,
+                rule.trigger_type,
+                rule.enabled,
+                self._rule_action_mode(rule),
+                list(rule.keyword_filter),
+            )
+            for rule in map(rule_map.get, stored_ids)
+            if rule is not None
+        ]
+        name = f"{guild.id}-{int(time.time())}.jsonl"
+        count = await asyncio.get_running_loop().run_in_executor(
+            None, write_snapshot, self._snapshot_path(name), guild.id, rules
         )
+        return name, count
+
+    async def _create_seed_rules(
+        self,
+        ctx: commands.Context,
+        count: int,
+        enabled: bool,
+        trigger_type: int = TRIGGER_TYPE_KEYWORD,
+        ttl: Optional[int] = None,
+    ) -> None:
+        if not self._has_manage_guild(ctx.guild):
+            await ctx.send(MANAGE_GUILD_REQUIRED)
+            return
+        params = {"count": count, "enabled": enabled, "trigger_type": trigger_type, "ttl": ttl}
+        job = BatchJob(ctx.guild.id, "create", params=params)
+        await self._submit(ctx, job)
+
+    # ---------------------
+    # Listeners
+    # ---------------------
+    @commands.Cog.listener()
+    async def on_automod_rule_create(self, rule: discord.AutoModRule) -> None:
+        self.rule_cache.upsert(rule.guild.id, rule.id, RuleRecord.from_rule(rule))
+
+    @commands.Cog.listener()
+    async def on_automod_rule_update(self, rule: discord.AutoModRule) -> None:
+        self.rule_cache.upsert(rule.guild.id, rule.id, RuleRecord.from_rule(rule))
+
+    @commands.Cog.listener()
+    async def on_automod_rule_delete(self, rule: discord.AutoModRule) -> None:
+        self.rule_cache.remove(rule.guild.id, rule.id)
+        self._forget_rules(rule.guild.id, [rule.id])
 
     # ---------------------
     # Commands
@@ -362,24 +1563,125 @@ class AutoModSeeder(commands.Cog):
         """Create random AutoMod rules for badge testing."""
         if not await self._is_owner(ctx):
             return
-        default_count = await self.config.guild(ctx.guild).default_count()
-        default_enabled = await self.config.guild(ctx.guild).default_enabled()
-        await self._create_seed_rules(ctx, default_count, default_enabled)
+        settings = await self.settings.get(ctx.guild.id)
+        await self._create_seed_rules(ctx, settings["default_count"], settings["default_enabled"])
 
     @automodseed.command(name="create")
     async def automodseed_create(
-        self, ctx: commands.Context, count: Optional[int] = None, enabled: Optional[str] = None
+        self,
+        ctx: commands.Context,
+        count: Optional[int] = None,
+        enabled: Optional[str] = None,
+        trigger: str = "keyword",
+        ttl: Optional[str] = None,
     ) -> None:
-        """Create AutoMod seed rules."""
+        """Create AutoMod seed rules.
+
+        `trigger` is one of keyword, spam, preset or mention. `ttl` (e.g. `30m`,
+        `2h`, `7d`) deletes the rules automatically once it has passed.
+        """
         if not await self._is_owner(ctx):
             return
+        trigger_type = SEED_TRIGGER_TYPES.get(trigger.lower())
+        if trigger_type is None:
+            raise commands.BadArgument("trigger는 keyword, spam, preset, mention 중 하나여야 합니다.")
+        ttl_seconds = None
+        if ttl is not None:
+            delta = commands.parse_timedelta(ttl, minimum=MIN_SEED_TTL, maximum=MAX_SEED_TTL)
+            if delta is None:
+                raise commands.BadArgument("ttl은 30m, 2h, 7d 같은 형식이어야 합니다.")
+            ttl_seconds = int(delta.total_seconds())
+        settings = await self.settings.get(ctx.guild.id)
         if count is None:
-            count = await self.config.guild(ctx.guild).default_count()
+            count = settings["default_count"]
         count = max(1, min(10, int(count)))
         enabled_value = self._parse_bool(enabled)
         if enabled_value is None:
-            enabled_value = await self.config.guild(ctx.guild).default_enabled()
-        await self._create_seed_rules(ctx, count, enabled_value)
+            enabled_value = settings["default_enabled"]
+        await self._create_seed_rules(ctx, count, enabled_value, trigger_type, ttl_seconds)
+
+    @automodseed.command(name="pack")
+    async def automodseed_pack(
+        self, ctx: commands.Context, count: Optional[int] = None, enabled: Optional[str] = None
+    ) -> None:
+        """Create seed rules filled to the per-rule keyword limit."""
+        if not await self._is_owner(ctx):
+            return
+        if not self._has_manage_guild(ctx.guild):
+            await ctx.send(MANAGE_GUILD_REQUIRED)
+            return
+        settings = await self.settings.get(ctx.guild.id)
+        count = max(1, min(10, int(settings["default_count"] if count is None else count)))
+        enabled_value = self._parse_bool(enabled)
+        if enabled_value is None:
+            enabled_value = settings["default_enabled"]
+        params = {"count": count, "enabled": enabled_value, "keywords_per_rule": MAX_KEYWORDS_PER_RULE}
+        await self._submit(ctx, BatchJob(ctx.guild.id, "create", params=params))
+
+    @automodseed.command(name="grow")
+    async def automodseed_grow(self, ctx: commands.Context, keywords: int) -> None:
+        """Add keywords to existing seed rules instead of creating new ones."""
+        if not await self._is_owner(ctx):
+            return
+        if not self._has_manage_guild(ctx.guild):
+            await ctx.send(MANAGE_GUILD_REQUIRED)
+            return
+        if keywords < 1:
+            await ctx.send("keywords는 1 이상이어야 합니다.")
+            return
+        await self._submit(ctx, BatchJob(ctx.guild.id, "grow", params={"keywords": keywords}))
+
+    @automodseed.command(name="apply")
+    async def automodseed_apply(self, ctx: commands.Context, *options: str) -> None:
+        """Reconcile seed rules with a desired state using the fewest writes.
+
+        Options: `rules=N keywords=N enabled=true|false mode=block|alert dry`
+        Omitted options keep the guild defaults; omitting `keywords` leaves
+        existing keyword lists alone.
+        """
+        if not await self._is_owner(ctx):
+            return
+        if not self._has_manage_guild(ctx.guild):
+            await ctx.send(MANAGE_GUILD_REQUIRED)
+            return
+        settings = await self.settings.get(ctx.guild.id)
+        values = {
+            "rules": str(settings["default_count"]),
+            "keywords": None,
+            "enabled": str(settings["default_enabled"]),
+            "mode": settings["action_mode"],
+        }
+        dry_run = False
+        for option in options:
+            key, sep, value = option.partition("=")
+            key = key.lower()
+            if not sep and key in {"dry", "dry-run", "--dry-run"}:
+                dry_run = True
+            elif sep and key in values:
+                values[key] = value
+            else:
+                raise commands.BadArgument(f"알 수 없는 옵션: {option}")
+        try:
+            rules = max(0, min(10, int(values["rules"])))
+            keywords = None
+            if values["keywords"] is not None:
+                keywords = max(1, min(MAX_KEYWORDS_PER_RULE, int(values["keywords"])))
+        except ValueError:
+            raise commands.BadArgument("rules와 keywords는 정수여야 합니다.")
+        mode = values["mode"].lower()
+        if mode not in {"block", "alert"}:
+            raise commands.BadArgument("mode는 block 또는 alert만 가능합니다.")
+        if mode == "alert" and not (settings["allow_alert_mode"] and settings["log_channel_id"]):
+            await ctx.send("alert 모드는 잠겨 있거나 로그 채널이 없습니다.")
+            return
+        desired = DesiredState(rules, keywords, self._parse_bool(values["enabled"]), mode)
+
+        if dry_run:
+            plan = await self._plan_apply(ctx.guild, desired)
+            await ctx.send(f"[dry-run]\n{self._format_plan(plan)}")
+            return
+        params = {"desired": vars(desired), "channel_id": settings["log_channel_id"]}
+        await self._submit(ctx, BatchJob(ctx.guild.id, "apply", params=params))
 
     @automodseed.command(name="list")
     async def automodseed_list(self, ctx: commands.Context) -> None:
@@ -405,16 +1707,20 @@ class AutoModSeeder(commands.Cog):
             return
         stored_ids, rule_map = await self._sync_seeded_ids(ctx.guild)
         actual_count = len([rule_id for rule_id in stored_ids if rule_id in rule_map])
-        last_run = await self.config.guild(ctx.guild).last_run_ts()
+        last_run = await self.settings.value(ctx.guild.id, "last_run_ts")
         last_run_text = "-"
         if last_run:
             dt = datetime.fromtimestamp(last_run, tz=timezone.utc)
             last_run_text = discord.utils.format_dt(dt, "R")
         lines = [
-            f"Config 저장 수: {len(stored_ids)}",
+            f"저장된 규칙 수: {len(stored_ids)}",
             f"실제 존재 수: {actual_count}",
             f"최근 실행: {last_run_text}",
         ]
+        expiring, next_expiry = self.store.next_expiry(ctx.guild.id)
+        if expiring:
+            dt = datetime.fromtimestamp(next_expiry, tz=timezone.utc)
+            lines.append(f"만료 예정: {expiring}개 (다음 {discord.utils.format_dt(dt, 'R')})")
         await ctx.send("\n".join(lines))
 
     @automodseed.command(name="purge")
@@ -423,62 +1729,9 @@ class AutoModSeeder(commands.Cog):
         if not await self._is_owner(ctx):
             return
         if not self._has_manage_guild(ctx.guild):
-            await ctx.send("봇에 서버 관리(Manage Guild) 권한이 필요합니다.")
-            return
-        stored_ids, rule_map = await self._sync_seeded_ids(ctx.guild)
-        if not stored_ids:
-            await ctx.send("삭제할 규칙이 없습니다.")
+            await ctx.send(MANAGE_GUILD_REQUIRED)
             return
-
-        success = 0
-        failed = 0
-        note = ""
-
-        for idx, rule_id in enumerate(list(stored_ids)):
-            await asyncio.sleep(random.uniform(CREATE_SLEEP_MIN, CREATE_SLEEP_MAX))
-            if idx > 0 and idx % BATCH_SLEEP_EVERY == 0:
-                await asyncio.sleep(BATCH_SLEEP_SECONDS)
-
-            rule = rule_map.get(rule_id)
-            if not rule:
-                stored_ids.remove(rule_id)
-                continue
-            try:
-                await self._delete_rule(ctx.guild, rule)
-                success += 1
-                stored_ids.remove(rule_id)
-            except discord.Forbidden:
-                failed += 1
-                note = "권한 부족"
-                break
-            except discord.HTTPException as exc:
-                status = getattr(exc, "status", None)
-                if status == 429:
-                    await self._sleep_with_backoff(1)
-                    try:
-                        await self._delete_rule(ctx.guild, rule)
-                        success += 1
-                        stored_ids.remove(rule_id)
-                        continue
-                    except discord.HTTPException:
-                        failed += 1
-                        note = "레이트리밋"
-                        break
-                failed += 1
-
-        await self.config.guild(ctx.guild).seeded_rule_ids.set(stored_ids)
-        summary = f"삭제 성공: {success}, 실패: {failed}"
-        if note:
-            summary += f" ({note})"
-        await ctx.send(summary)
-        await self._maybe_log(
-            ctx.guild,
-            action="purge",
-            requested=success + failed,
-            success=success,
-            failed=failed,
-            note=note,
-        )
+        await self._submit(ctx, BatchJob(ctx.guild.id, "purge"))
 
     @automodseed.command(name="enableall")
     async def automodseed_enableall(self, ctx: commands.Context) -> None:
@@ -486,60 +1739,158 @@ class AutoModSeeder(commands.Cog):
         if not await self._is_owner(ctx):
             return
         if not self._has_manage_guild(ctx.guild):
-            await ctx.send("봇에 서버 관리(Manage Guild) 권한이 필요합니다.")
+            await ctx.send(MANAGE_GUILD_REQUIRED)
             return
-        stored_ids, rule_map = await self._sync_seeded_ids(ctx.guild)
-        if not stored_ids:
-            await ctx.send("활성화할 규칙이 없습니다.")
+        await self._submit(ctx, BatchJob(ctx.guild.id, "enableall"))
+
+    @automodseed.command(name="metrics")
+    async def automodseed_metrics(self, ctx: commands.Context) -> None:
+        """Show REST latency, status counts and wait times since load."""
+        if not await self._is_owner(ctx):
             return
+        await ctx.send(self._format_metrics())
 
-        success = 0
-        failed = 0
-        note = ""
+    @automodseed.command(name="jobs")
+    async def automodseed_jobs(self, ctx: commands.Context) -> None:
+        """List queued and running seed jobs in this guild."""
+        if not await self._is_owner(ctx):
+            return
+        jobs = self._queue.guild_jobs(ctx.guild.id)
+        if not jobs:
+            await ctx.send("대기 중이거나 실행 중인 작업이 없습니다.")
+            return
+        lines = [
+            f"`{job.job_id}` {job.action} [{job.state}] {job.position}/{job.total or '-'}"
+            for job in jobs
+        ]
+        await ctx.send("\n".join(lines))
 
-        for idx, rule_id in enumerate(list(stored_ids)):
-            await asyncio.sleep(random.uniform(CREATE_SLEEP_MIN, CREATE_SLEEP_MAX))
-            if idx > 0 and idx % BATCH_SLEEP_EVERY == 0:
-                await asyncio.sleep(BATCH_SLEEP_SECONDS)
+    @automodseed.command(name="simulate")
+    async def automodseed_simulate(self, ctx: commands.Context, *, text: Optional[str] = None) -> None:
+        """Predict which keyword rules would block a message, without sending it.
 
-            rule = rule_map.get(rule_id)
-            if not rule:
-                stored_ids.remove(rule_id)
-                continue
-            try:
-                await self._enable_rule(ctx.guild, rule)
-                success += 1
-            except discord.Forbidden:
-                failed += 1
-                note = "권한 부족"
-                break
-            except discord.HTTPException as exc:
-                status = getattr(exc, "status", None)
-                if status == 429:
-                    await self._sleep_with_backoff(1)
-                    try:
-                        await self._enable_rule(ctx.guild, rule)
-                        success += 1
-                        continue
-                    except discord.HTTPException:
-                        failed += 1
-                        note = "레이트리밋"
-                        break
-                failed += 1
-
-        summary = f"활성화 성공: {success}, 실패: {failed}"
-        if note:
-            summary += f" ({note})"
-        await ctx.send(summary)
-        await self._maybe_log(
-            ctx.guild,
-            action="enableall",
-            requested=success + failed,
-            success=success,
-            failed=failed,
-            note=note,
+        Attach a text file instead of `text` to run a corpus, one message per line.
+        """
+        if not await self._is_owner(ctx):
+            return
+        if text is not None:
+            messages = [text]
+        elif ctx.message.attachments:
+            data = await ctx.message.attachments[0].read()
+            messages = [line for line in data.decode("utf-8", "replace").splitlines() if line]
+        else:
+            await ctx.send("메시지 텍스트나 코퍼스 파일(한 줄에 메시지 하나)을 첨부하세요.")
+            return
+        async with ctx.typing():
+            matcher, report = await self._simulate_matches(ctx.guild, messages)
+        for page in pagify(self._format_simulation(ctx.guild, matcher, report)):
+            await ctx.send(page)
+
+    @automodseed.command(name="export")
+    async def automodseed_export(self, ctx: commands.Context) -> None:
+        """Save this guild's seed rules to a snapshot file for `import`."""
+        if not await self._is_owner(ctx):
+            return
+        async with ctx.typing():
+            name, count = await self._export_snapshot(ctx.guild)
+        if not count:
+            await ctx.send("내보낼 시드 규칙이 없습니다.")
+            return
+        await ctx.send(
+            f"규칙 {count}개를 `{name}`(으)로 내보냈습니다.",
+            file=discord.File(str(self._snapshot_path(name)), filename=name),
         )
 
+    @automodseed.command(name="import")
+    async def automodseed_import(self, ctx: commands.Context, snapshot: str, *guild_ids: int) -> None:
+        """Recreate the rules of an exported snapshot here or in the given guilds.
+
+        Each target guild gets its own job; an interrupted import resumes from
+        the last rule it read.
+        """
+        if not await self._is_owner(ctx):
+            return
+        if not self._snapshot_path(snapshot).is_file():
+            await ctx.send(f"스냅샷 `{snapshot}`을(를) 찾을 수 없습니다.")
+            return
+        guilds = [ctx.guild] if not guild_ids else [self.bot.get_guild(guild_id) for guild_id in guild_ids]
+        missing = [guild_id for guild_id, guild in zip(guild_ids, guilds) if guild is None]
+        if missing:
+            await ctx.send("찾을 수 없는 길드: " + ", ".join(str(guild_id) for guild_id in missing))
+        for guild in filter(None, guilds):
+            await self._submit(ctx, BatchJob(guild.id, "import", params={"snapshot": snapshot}))
+
+    @automodseed.command(name="cancel")
+    async def automodseed_cancel(self, ctx: commands.Context, job_id: Optional[str] = None) -> None:
+        """Cancel one job by ID, or every job in this guild."""
+        if not await self._is_owner(ctx):
+            return
+        jobs = self._queue.guild_jobs(ctx.guild.id)
+        if job_id is not None:
+            jobs = [job for job in jobs if job.job_id == job_id]
+            if not jobs:
+                await ctx.send(f"작업 `{job_id}`을(를) 찾을 수 없습니다.")
+                return
+        for job in jobs:
+            self._queue.cancel(job.job_id)
+        await ctx.send(f"취소 요청: {len(jobs)}개 작업" if jobs else "실행 중인 작업이 없습니다.")
+
+    @automodseed.group(name="fleet")
+    async def automodseed_fleet(self, ctx: commands.Context) -> None:
+        """Run seed commands across many guilds at once.
+
+        Targets are `all`, `seeded` (guilds with stored seed rules) or a
+        comma-separated list of guild IDs.
+        """
+        if not await self._is_owner(ctx):
+            return
+
+    @automodseed_fleet.command(name="create")
+    async def automodseed_fleet_create(
+        self,
+        ctx: commands.Context,
+        target: str,
+        count: Optional[int] = None,
+        enabled: Optional[str] = None,
+    ) -> None:
+        """Create seed rules in every target guild."""
+        if not await self._is_owner(ctx):
+            return
+        enabled_value = self._parse_bool(enabled)
+
+        async def seed(guild: discord.Guild) -> OperationResult:
+            settings = await self.settings.get(guild.id)
+            guild_count = settings["default_count"] if count is None else count
+            guild_enabled = settings["default_enabled"] if enabled_value is None else enabled_value
+            return await self._seed_guild(guild, max(1, min(10, int(guild_count))), guild_enabled)
+
+        await self._run_fleet(ctx, "create", target, seed)
+
+    @automodseed_fleet.command(name="purge")
+    async def automodseed_fleet_purge(self, ctx: commands.Context, target: str = "seeded") -> None:
+        """Delete seed rules in every target guild."""
+        if not await self._is_owner(ctx):
+            return
+        await self._run_fleet(ctx, "purge", target, self._purge_guild)
+
+    @automodseed_fleet.command(name="enableall")
+    async def automodseed_fleet_enableall(self, ctx: commands.Context, target: str = "seeded") -> None:
+        """Enable seed rules in every target guild."""
+        if not await self._is_owner(ctx):
+            return
+        await self._run_fleet(ctx, "enableall", target, self._enable_guild)
+
+    @automodseed_fleet.command(name="concurrency")
+    async def automodseed_fleet_concurrency(
+        self, ctx: commands.Context, limit: Optional[int] = None
+    ) -> None:
+        """Show or set how many guilds a fleet command processes at once."""
+        if not await self._is_owner(ctx):
+            return
+        if limit is not None:
+            await self.config.fleet_concurrency.set(max(1, min(50, limit)))
+        await ctx.send(f"fleet_concurrency = {await self.config.fleet_concurrency()}")
+
     @automodseed.group(name="set")
     async def automodseed_set(self, ctx: commands.Context) -> None:
         """Optional settings for AutoModSeeder."""
@@ -555,13 +1906,39 @@ class AutoModSeeder(commands.Cog):
         if mode not in {"block", "alert"}:
             await ctx.send("mode는 block 또는 alert만 가능합니다.")
             return
-        allow = await self.config.guild(ctx.guild).allow_alert_mode()
+        allow = await self.settings.value(ctx.guild.id, "allow_alert_mode")
         if mode == "alert" and not allow:
             await ctx.send("alert 모드는 잠겨 있습니다.")
             return
-        await self.config.guild(ctx.guild).action_mode.set(mode)
+        self.settings.set(ctx.guild.id, "action_mode", mode)
         await ctx.send(f"action_mode = {mode}")
 
+    @automodseed_set.command(name="metricsfile")
+    async def automodseed_set_metricsfile(self, ctx: commands.Context, value: Optional[str] = None) -> None:
+        """Toggle the periodic Prometheus metrics file in the cog data folder."""
+        if not await self._is_owner(ctx):
+            return
+        enabled = self._parse_bool(value)
+        if enabled is None:
+            enabled = not self._metrics_file_enabled
+        self._metrics_file_enabled = enabled
+        await self.config.metrics_file.set(enabled)
+        if enabled:
+            self._write_metrics_file()
+        await ctx.send(f"metrics_file = {enabled}")
+
+    @automodseed_set.command(name="coordpath")
+    async def automodseed_set_coordpath(self, ctx: commands.Context, path: Optional[str] = None) -> None:
+        """Show or set the coordination file shared by bot processes (`default` resets it)."""
+        if not await self._is_owner(ctx):
+            return
+        if path is not None:
+            await self.config.coordination_path.set(None if path.lower() == "default" else path)
+            # Leases held by running jobs live in the open file; switch on the next load.
+            await ctx.send(f"coordination_path = {await self._coordination_path()} (다음 로드부터 적용)")
+            return
+        await ctx.send(f"coordination_path = {await self._coordination_path()}")
+
     @automodseed_set.command(name="lockdenied")
     async def automodseed_set_lockdenied(self, ctx: commands.Context, value: Optional[str] = None) -> None:
         """Toggle silent deny for non-owner users."""
@@ -569,6 +1946,6 @@ class AutoModSeeder(commands.Cog):
             return
         silent = self._parse_bool(value)
         if silent is None:
-            silent = not await self.config.guild(ctx.guild).silent_denied()
-        await self.config.guild(ctx.guild).silent_denied.set(silent)
+            silent = not await self.settings.value(ctx.guild.id, "silent_denied")
+        self.settings.set(ctx.guild.id, "silent_denied", silent)
         await ctx.send(f"silent_denied = {silent}")
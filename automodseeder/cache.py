@@ -0,0 +1,55 @@
+import time
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+class _Entry(Generic[R]):
+    __slots__ = ("rules", "loaded_at")
+
+    def __init__(self, rules: Dict[int, R], loaded_at: float) -> None:
+        self.rules = rules
+        self.loaded_at = loaded_at
+
+
+class RuleCache(Generic[R]):
+    """Per-guild AutoMod rule index, warmed lazily and patched by gateway events.
+
+    An entry is only trusted for ``ttl`` seconds after the last full fetch so
+    missed events (no auto_moderation_configuration intent, reconnects) heal.
+    """
+
+    def __init__(self, ttl: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[int, _Entry[R]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, guild_id: int) -> Optional[Dict[int, R]]:
+        rules = self.peek(guild_id)
+        if rules is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return rules
+
+    def peek(self, guild_id: int) -> Optional[Dict[int, R]]:
+        """Like ``get`` but leaves the hit/miss counters alone."""
+        entry = self._entries.get(guild_id)
+        if entry is None or self._clock() - entry.loaded_at > self.ttl:
+            return None
+        return entry.rules
+
+    def set(self, guild_id: int, rules: Dict[int, R]) -> None:
+        self._entries[guild_id] = _Entry(rules, self._clock())
+
+    def upsert(self, guild_id: int, rule_id: int, rule: R) -> None:
+        entry = self._entries.get(guild_id)
+        if entry is not None:
+            entry.rules[rule_id] = rule
+
+    def remove(self, guild_id: int, rule_id: int) -> None:
+        entry = self._entries.get(guild_id)
+        if entry is not None:
+            entry.rules.pop(rule_id, None)
@@ -0,0 +1,124 @@
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    bucket_limit INTEGER,
+    remaining INTEGER NOT NULL,
+    reset_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    guild_key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+# Reset times from two processes within this many seconds are the same window.
+SAME_WINDOW_SLACK = 0.5
+
+
+class LeaseBusy(Exception):
+    """Another process holds the guild's operation lease."""
+
+
+class SharedCoordinator:
+    """Rate-limit buckets and guild leases shared by every process on a host.
+
+    State lives in one SQLite file and every read-modify-write runs in a
+    ``BEGIN IMMEDIATE`` transaction, so processes serialize on the file lock
+    rather than on anything in-process. Times are wall-clock so they compare
+    across processes.
+
+    A bucket holds the tokens Discord reported as ``remaining`` for the window
+    ending at ``reset_at``; ``reserve`` takes a token before a request, and
+    ``observe`` folds a response's headers back in. A lease names the process
+    allowed to mutate a guild's seed rules until ``expires_at``; a crashed
+    holder simply stops renewing and the lease lapses.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._conn = sqlite3.connect(str(path), isolation_level=None, timeout=5.0)
+        if str(path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ---------------------
+    # Buckets
+    # ---------------------
+    def reserve(self, key: str) -> float:
+        """Take a token from ``key``; return how long to wait first (0 if none)."""
+        now = self._clock()
+        with _Immediate(self._conn):
+            row = self._conn.execute(
+                "SELECT remaining, reset_at FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now >= row[1]:
+                # Unknown or expired window: the response headers will tell.
+                return 0.0
+            remaining, reset_at = row
+            if remaining > 0:
+                self._conn.execute("UPDATE buckets SET remaining = remaining - 1 WHERE key = ?", (key,))
+                return 0.0
+            return reset_at - now
+
+    def observe(self, key: str, *, limit: Optional[int], remaining: int, reset_after: float) -> None:
+        reset_at = self._clock() + max(0.0, reset_after)
+        with _Immediate(self._conn):
+            row = self._conn.execute(
+                "SELECT remaining, reset_at FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and abs(row[1] - reset_at) <= SAME_WINDOW_SLACK:
+                # Same window: other processes may have reserved tokens since
+                # this response was generated, so never raise the count.
+                remaining = min(remaining, row[0])
+                reset_at = max(reset_at, row[1])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, bucket_limit, remaining, reset_at) VALUES (?, ?, ?, ?)",
+                (key, limit, remaining, reset_at),
+            )
+
+    # ---------------------
+    # Leases
+    # ---------------------
+    def acquire_lease(self, guild_key: str, owner: str, ttl: float) -> bool:
+        """Take or renew the lease; False while another live owner holds it."""
+        now = self._clock()
+        with _Immediate(self._conn):
+            row = self._conn.execute(
+                "SELECT owner, expires_at FROM leases WHERE guild_key = ?", (guild_key,)
+            ).fetchone()
+            if row is not None and row[0] != owner and row[1] > now:
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO leases (guild_key, owner, expires_at) VALUES (?, ?, ?)",
+                (guild_key, owner, now + ttl),
+            )
+            return True
+
+    def release_lease(self, guild_key: str, owner: str) -> None:
+        self._conn.execute("DELETE FROM leases WHERE guild_key = ? AND owner = ?", (guild_key, owner))
+
+
+class _Immediate:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
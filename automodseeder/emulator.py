@@ -0,0 +1,572 @@
+"""In-process stand-in for Discord's auto-moderation REST endpoints.
+
+``AutoModEmulator`` holds the rules and answers requests with Discord-shaped
+status codes, bodies and rate-limit headers. ``EmulatorServer`` serves it over
+aiohttp so a real discord.py ``HTTPClient`` can talk to it; see
+``emulated_http``. ``loopback_http`` skips the sockets and answers in-process.
+Run ``python -m automodseeder.emulator`` for an offline
+create/enableall/purge throughput check against the cog.
+"""
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import discord
+from aiohttp import web
+from multidict import CIMultiDict
+
+from .planner import RULE_CAPS
+from .validation import ACTION_SEND_ALERT
+
+API_PREFIX = "/api/v10"
+
+# Scripted fault that never answers; clients see a timeout or disconnect.
+FAULT_TIMEOUT = -1
+
+
+@dataclass
+class EmulatorOptions:
+    # Per-route, per-guild window: ``rate_limit`` requests every ``rate_window`` seconds.
+    rate_limit: int = 5
+    rate_window: float = 5.0
+    # Optional per-method override, e.g. {"POST": (5, 20.0)}.
+    route_limits: Dict[str, Tuple[int, float]] = field(default_factory=dict)
+    # Requests per second across every route; None disables the global limit.
+    global_limit: Optional[int] = None
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability that a request fails with one of ``fault_statuses``.
+    fault_rate: float = 0.0
+    fault_statuses: Tuple[int, ...] = (500, 502, 503)
+    # ``retry_after`` sent with an injected 429.
+    fault_retry_after: float = 1.0
+    # How long a FAULT_TIMEOUT request hangs before the connection is dropped.
+    hang_seconds: float = 30.0
+    rule_caps: Dict[int, int] = field(default_factory=lambda: dict(RULE_CAPS))
+    max_keywords: int = 1000
+    max_keyword_length: int = 60
+    seed: Optional[int] = None
+
+
+class Reply(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: Any
+
+
+@dataclass
+class _Window:
+    remaining: int
+    reset_at: float
+
+
+def _error(status: int, message: str, code: int, errors: Optional[Dict[str, Any]] = None) -> Reply:
+    body: Dict[str, Any] = {"message": message, "code": code}
+    if errors:
+        body["errors"] = errors
+    return Reply(status, {}, body)
+
+
+def _form_error(path: str, code: str, message: str) -> Reply:
+    errors: Dict[str, Any] = {}
+    node = errors
+    for part in path.split("."):
+        node = node.setdefault(part, {})
+    node["_errors"] = [{"code": code, "message": message}]
+    return _error(400, "Invalid Form Body", 50035, errors)
+
+
+class AutoModEmulator:
+    """Rules, caps, rate-limit windows and fault injection for fake guilds.
+
+    ``dispatch`` answers one request synchronously; ``handle`` adds the
+    configured latency first. Every answer is also tallied in ``calls`` (by
+    method) and ``statuses`` (by status code).
+    """
+
+    def __init__(
+        self,
+        options: Optional[EmulatorOptions] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.options = options or EmulatorOptions()
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random.Random(self.options.seed)
+        self._ids = itertools.count(1_300_000_000_000_000_000)
+        self.guilds: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        self.forbidden: set = set()
+        self._faults: Dict[str, List[int]] = {}
+        self._windows: Dict[Tuple[str, int], _Window] = {}
+        self._global: Optional[_Window] = None
+        self.calls: Counter = Counter()
+        self.statuses: Counter = Counter()
+
+    # ---------------------
+    # Setup
+    # ---------------------
+    def add_guild(self, guild_id: int, *, manage_guild: bool = True) -> None:
+        self.guilds.setdefault(guild_id, {})
+        if manage_guild:
+            self.forbidden.discard(guild_id)
+        else:
+            self.forbidden.add(guild_id)
+
+    def inject(self, method: str, *statuses: int) -> None:
+        """Answer the next requests of ``method`` with ``statuses``, in order."""
+        self._faults.setdefault(method.upper(), []).extend(statuses)
+
+    def rules(self, guild_id: int) -> List[Dict[str, Any]]:
+        return list(self.guilds.get(guild_id, {}).values())
+
+    def reset_stats(self) -> None:
+        self.calls.clear()
+        self.statuses.clear()
+
+    # ---------------------
+    # Requests
+    # ---------------------
+    async def handle(
+        self, method: str, guild_id: int, rule_id: Optional[int] = None, body: Any = None
+    ) -> Reply:
+        delay = self.options.latency
+        if self.options.jitter:
+            delay += self._random.uniform(0, self.options.jitter)
+        if delay > 0:
+            await self._sleep(delay)
+        return self.dispatch(method, guild_id, rule_id, body)
+
+    def dispatch(
+        self, method: str, guild_id: int, rule_id: Optional[int] = None, body: Any = None
+    ) -> Reply:
+        method = method.upper()
+        self.calls[method] += 1
+        reply = self._dispatch(method, guild_id, rule_id, body)
+        self.statuses[reply.status] += 1
+        return reply
+
+    def _dispatch(self, method: str, guild_id: int, rule_id: Optional[int], body: Any) -> Reply:
+        fault = self._next_fault(method)
+        if fault == FAULT_TIMEOUT:
+            return Reply(FAULT_TIMEOUT, {}, None)
+
+        limited = self._take_global()
+        if limited is not None:
+            return limited
+        headers = self._take(method, rule_id is not None, guild_id)
+        if isinstance(headers, Reply):
+            return headers
+        if fault == 429:
+            return self._too_many(self.options.fault_retry_after, is_global=False)
+        if fault:
+            return Reply(fault, headers, {"message": f"{fault}: Emulated fault", "code": 0})
+
+        if guild_id not in self.guilds:
+            reply = _error(404, "Unknown Guild", 10004)
+        elif guild_id in self.forbidden:
+            reply = _error(403, "Missing Permissions", 50013)
+        elif rule_id is None:
+            reply = self._list(guild_id) if method == "GET" else self._create(guild_id, body)
+        elif rule_id not in self.guilds[guild_id]:
+            reply = _error(404, "404: Not Found", 0)
+        elif method == "GET":
+            reply = Reply(200, {}, self.guilds[guild_id][rule_id])
+        elif method == "PATCH":
+            reply = self._edit(guild_id, rule_id, body)
+        else:
+            del self.guilds[guild_id][rule_id]
+            reply = Reply(204, {}, None)
+        reply.headers.update(headers)
+        return reply
+
+    def _next_fault(self, method: str) -> int:
+        scripted = self._faults.get(method)
+        if scripted:
+            return scripted.pop(0)
+        if self.options.fault_rate and self._random.random() < self.options.fault_rate:
+            return self._random.choice(self.options.fault_statuses)
+        return 0
+
+    def _take_global(self) -> Optional[Reply]:
+        if self.options.global_limit is None:
+            return None
+        now = self._clock()
+        window = self._global
+        if window is None or now >= window.reset_at:
+            window = self._global = _Window(self.options.global_limit, now + 1.0)
+        if window.remaining <= 0:
+            return self._too_many(window.reset_at - now, is_global=True)
+        window.remaining -= 1
+        return None
+
+    def _take(self, method: str, has_rule_id: bool, guild_id: int) -> Union[Dict[str, str], Reply]:
+        """Spend one request from the route window.
+
+        Returns the rate-limit headers for the response, or a 429 ``Reply``
+        when the window is exhausted.
+        """
+        route = f"{method} /guilds/{{guild_id}}/auto-moderation/rules" + ("/{rule_id}" if has_rule_id else "")
+        bucket = hashlib.sha1(route.encode()).hexdigest()[:16]
+        limit, period = self.options.route_limits.get(
+            method, (self.options.rate_limit, self.options.rate_window)
+        )
+        now = self._clock()
+        window = self._windows.get((bucket, guild_id))
+        if window is None or now >= window.reset_at:
+            window = self._windows[(bucket, guild_id)] = _Window(limit, now + period)
+        reset_after = max(0.0, window.reset_at - now)
+        if window.remaining <= 0:
+            reply = self._too_many(reset_after, is_global=False)
+            reply.headers.update(self._limit_headers(bucket, limit, 0, reset_after))
+            return reply
+        window.remaining -= 1
+        return self._limit_headers(bucket, limit, window.remaining, reset_after)
+
+    def _limit_headers(self, bucket: str, limit: int, remaining: int, reset_after: float) -> Dict[str, str]:
+        return {
+            "X-RateLimit-Bucket": bucket,
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": f"{time.time() + reset_after:.3f}",
+            "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+        }
+
+    def _too_many(self, retry_after: float, *, is_global: bool) -> Reply:
+        retry_after = round(max(retry_after, 0.001), 3)
+        headers = {
+            "Retry-After": str(math.ceil(retry_after)),
+            "X-RateLimit-Scope": "global" if is_global else "user",
+            # discord.py treats a 429 without Via as a Cloudflare ban.
+            "Via": "1.1 google",
+        }
+        if is_global:
+            headers["X-RateLimit-Global"] = "true"
+        body = {"message": "You are being rate limited.", "retry_after": retry_after, "global": is_global}
+        return Reply(429, headers, body)
+
+    # ---------------------
+    # Rule endpoints
+    # ---------------------
+    def _list(self, guild_id: int) -> Reply:
+        return Reply(200, {}, self.rules(guild_id))
+
+    def _create(self, guild_id: int, body: Any) -> Reply:
+        body = body or {}
+        if not body.get("name"):
+            return _form_error("name", "BASE_TYPE_REQUIRED", "This field is required")
+        trigger_type = body.get("trigger_type")
+        if trigger_type not in self.options.rule_caps:
+            return _form_error("trigger_type", "BASE_TYPE_CHOICES", "Value must be one of the trigger types.")
+        existing = sum(1 for rule in self.guilds[guild_id].values() if rule["trigger_type"] == trigger_type)
+        if existing >= self.options.rule_caps[trigger_type]:
+            return _form_error(
+                "trigger_type",
+                "AUTO_MODERATION_MAX_RULES_OF_TYPE_EXCEEDED",
+                "Maximum number of rules of this type exceeded",
+            )
+        invalid = self._validate(body)
+        if invalid:
+            return invalid
+        rule_id = next(self._ids)
+        rule = {
+            "id": str(rule_id),
+            "guild_id": str(guild_id),
+            "name": body["name"],
+            "creator_id": "1",
+            "event_type": body.get("event_type", 1),
+            "trigger_type": trigger_type,
+            "trigger_metadata": body.get("trigger_metadata") or {},
+            "actions": body.get("actions") or [],
+            "enabled": bool(body.get("enabled", False)),
+            "exempt_roles": body.get("exempt_roles") or [],
+            "exempt_channels": body.get("exempt_channels") or [],
+        }
+        self.guilds[guild_id][rule_id] = rule
+        return Reply(200, {}, rule)
+
+    def _edit(self, guild_id: int, rule_id: int, body: Any) -> Reply:
+        body = body or {}
+        invalid = self._validate(body)
+        if invalid:
+            return invalid
+        rule = self.guilds[guild_id][rule_id]
+        for key in ("name", "event_type", "trigger_metadata", "actions", "enabled", "exempt_roles", "exempt_channels"):
+            if key in body:
+                rule[key] = body[key]
+        return Reply(200, {}, rule)
+
+    def _validate(self, body: Dict[str, Any]) -> Optional[Reply]:
+        keywords = (body.get("trigger_metadata") or {}).get("keyword_filter") or []
+        if len(keywords) > self.options.max_keywords:
+            return _form_error(
+                "trigger_metadata.keyword_filter",
+                "BASE_TYPE_MAX_LENGTH",
+                f"Must be {self.options.max_keywords} or fewer in length.",
+            )
+        for index, keyword in enumerate(keywords):
+            if len(keyword) > self.options.max_keyword_length:
+                return _form_error(
+                    f"trigger_metadata.keyword_filter.{index}",
+                    "BASE_TYPE_BAD_LENGTH",
+                    f"Must be between 1 and {self.options.max_keyword_length} in length.",
+                )
+        for index, action in enumerate(body.get("actions") or []):
+            if action.get("type") == ACTION_SEND_ALERT and not (action.get("metadata") or {}).get("channel_id"):
+                return _form_error(
+                    f"actions.{index}.metadata.channel_id", "BASE_TYPE_REQUIRED", "This field is required"
+                )
+        return None
+
+
+def _json_response(body: Any, *, status: int = 200, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    # discord.py only decodes bodies whose content type is exactly application/json.
+    headers = dict(headers or {}, **{"Content-Type": "application/json"})
+    return web.Response(body=json.dumps(body).encode(), status=status, headers=headers)
+
+
+class EmulatorServer:
+    """Serves an ``AutoModEmulator`` under ``/api/v10`` on a local port."""
+
+    def __init__(self, emulator: AutoModEmulator, *, user_id: int = 1) -> None:
+        self.emulator = emulator
+        self.user_id = user_id
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        rules = API_PREFIX + "/guilds/{guild_id}/auto-moderation/rules"
+        app.router.add_get(API_PREFIX + "/users/@me", self._me)
+        app.router.add_route("*", rules, self._rules)
+        app.router.add_route("*", rules + "/{rule_id}", self._rules)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = self._runner.addresses[0]
+        self.base_url = f"http://{bound[0]}:{bound[1]}{API_PREFIX}"
+        return self.base_url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _authorized(self, request: web.Request) -> bool:
+        return request.headers.get("Authorization", "").startswith("Bot ")
+
+    async def _me(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return _json_response({"message": "401: Unauthorized", "code": 0}, status=401)
+        return _json_response(
+            {"id": str(self.user_id), "username": "emulator", "discriminator": "0", "avatar": None, "bot": True}
+        )
+
+    async def _rules(self, request: web.Request) -> web.StreamResponse:
+        if not self._authorized(request):
+            return _json_response({"message": "401: Unauthorized", "code": 0}, status=401)
+        try:
+            guild_id = int(request.match_info["guild_id"])
+            rule_id = request.match_info.get("rule_id")
+            rule_id = int(rule_id) if rule_id is not None else None
+        except ValueError:
+            return _json_response({"message": "404: Not Found", "code": 0}, status=404)
+        body = await request.json() if request.can_read_body else None
+        reply = await self.emulator.handle(request.method, guild_id, rule_id, body)
+        if reply.status == FAULT_TIMEOUT:
+            await asyncio.sleep(self.emulator.options.hang_seconds)
+            if request.transport is not None:
+                request.transport.close()
+            return web.Response(status=504)
+        if reply.body is None:
+            return web.Response(status=reply.status, headers=reply.headers)
+        return _json_response(reply.body, status=reply.status, headers=reply.headers)
+
+
+@asynccontextmanager
+async def emulated_http(
+    emulator: AutoModEmulator, *, token: str = "emulator"
+) -> AsyncIterator[discord.http.HTTPClient]:
+    """Start a server for ``emulator`` and yield a logged-in discord.py HTTPClient.
+
+    ``discord.http.Route.BASE`` is process-wide, so every Route built inside
+    the block targets the emulator; it is restored on exit. Assign the client
+    to ``bot.http`` (and the guild state's ``http``) to point the cog at it.
+    """
+    server = EmulatorServer(emulator)
+    base_url = await server.start()
+    previous_base = discord.http.Route.BASE
+    discord.http.Route.BASE = base_url
+    client = discord.http.HTTPClient(asyncio.get_running_loop())
+    try:
+        await client.static_login(token)
+        yield client
+    finally:
+        discord.http.Route.BASE = previous_base
+        await client.close()
+        await server.close()
+
+
+RULES_URL = re.compile(r"/guilds/(\d+)/auto-moderation/rules(?:/(\d+))?$")
+
+
+class _LoopbackResponse:
+    def __init__(self, reply: Reply) -> None:
+        self.status = reply.status
+        try:
+            self.reason = HTTPStatus(reply.status).phrase
+        except ValueError:
+            self.reason = ""
+        self.headers = CIMultiDict(reply.headers)
+        self._text = ""
+        if reply.body is not None:
+            self.headers["Content-Type"] = "application/json"
+            self._text = json.dumps(reply.body)
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._text
+
+
+class _LoopbackRequest:
+    def __init__(self, emulator: AutoModEmulator, method: str, url: str, data: Optional[str]) -> None:
+        self._emulator = emulator
+        self._method = method
+        self._url = url
+        self._data = data
+
+    async def __aenter__(self) -> _LoopbackResponse:
+        match = RULES_URL.search(self._url.split("?", 1)[0])
+        if match is None:
+            return _LoopbackResponse(_error(404, "404: Not Found", 0))
+        rule_id = int(match.group(2)) if match.group(2) else None
+        body = json.loads(self._data) if self._data else None
+        reply = await self._emulator.handle(self._method, int(match.group(1)), rule_id, body)
+        if reply.status == FAULT_TIMEOUT:
+            await self._emulator._sleep(self._emulator.options.hang_seconds)
+            raise asyncio.TimeoutError()
+        return _LoopbackResponse(reply)
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class LoopbackSession:
+    """Stands in for discord.py's aiohttp session and answers from the emulator."""
+
+    closed = False
+
+    def __init__(self, emulator: AutoModEmulator) -> None:
+        self.emulator = emulator
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _LoopbackRequest:
+        return _LoopbackRequest(self.emulator, method, url, kwargs.get("data"))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def loopback_http(emulator: AutoModEmulator, *, token: str = "emulator") -> discord.http.HTTPClient:
+    """A discord.py HTTPClient whose requests ``emulator`` answers in-process.
+
+    Nothing touches a socket, so it also runs on a virtual-clock event loop;
+    discord.py's own bucket tracking and 429/5xx retries stay in the path.
+    Must be called with the event loop running.
+    """
+    client = discord.http.HTTPClient(asyncio.get_running_loop())
+    # Mirrors what static_login() sets up, minus the real session and /users/@me.
+    client._HTTPClient__session = LoopbackSession(emulator)
+    client._global_over = asyncio.Event()
+    client._global_over.set()
+    client.token = token
+    return client
+
+
+# ---------------------
+# Offline throughput check
+# ---------------------
+async def measure_throughput(
+    guild_count: int, rules: int, options: Optional[EmulatorOptions] = None
+) -> Dict[str, Any]:
+    from .coordination import SharedCoordinator
+    from .sandbox import Sandbox
+
+    def configure(cog: Any) -> None:
+        # Private buckets and leases; the configured file may be shared with a live bot.
+        cog.coordinator = SharedCoordinator(":memory:")
+
+    emulator = AutoModEmulator(options)
+    guild_ids = [10_000 + index for index in range(guild_count)]
+    for guild_id in guild_ids:
+        emulator.add_guild(guild_id)
+    report: Dict[str, Any] = {"guilds": guild_count, "rules": rules, "phases": []}
+    async with emulated_http(emulator) as client, Sandbox(
+        client, guild_ids, configure=configure
+    ) as sandbox:
+        cog = sandbox.cog
+        phases = (
+            ("create", lambda guild: cog._seed_guild(guild, rules, False)),
+            ("enableall", cog._enable_guild),
+            ("purge", cog._purge_guild),
+        )
+        for name, run in phases:
+            emulator.reset_stats()
+            started = time.perf_counter()
+            results = await asyncio.gather(*(run(guild) for guild in sandbox.guilds))
+            elapsed = time.perf_counter() - started
+            report["phases"].append(
+                {
+                    "phase": name,
+                    "seconds": round(elapsed, 3),
+                    "success": sum(result.success for result in results),
+                    "failed": sum(result.failed for result in results),
+                    "ops_per_second": round(sum(result.success for result in results) / elapsed, 2)
+                    if elapsed
+                    else None,
+                    "calls": dict(emulator.calls),
+                    "statuses": {str(status): count for status, count in sorted(emulator.statuses.items())},
+                }
+            )
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=2)
+    parser.add_argument("--rules", type=int, default=6)
+    parser.add_argument("--rate-limit", type=int, default=5)
+    parser.add_argument("--rate-window", type=float, default=5.0)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--fault-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    options = EmulatorOptions(
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        latency=args.latency,
+        jitter=args.jitter,
+        fault_rate=args.fault_rate,
+        seed=args.seed,
+    )
+    report = asyncio.run(measure_throughput(args.guilds, args.rules, options))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger("red.automodseeder.expiry")
+
+Expire = Callable[[int, List[int]], Awaitable[None]]
+
+
+class ExpiryScheduler:
+    """One min-heap of rule deadlines across every guild.
+
+    The loop sleeps until the earliest deadline (or until an earlier one is
+    scheduled), then pops everything due within ``window`` seconds of it and
+    hands each guild's rule IDs to ``expire`` as one batch. Rescheduling or
+    unscheduling a rule leaves its old heap entry behind; entries that no
+    longer match ``_deadlines`` are skipped when popped.
+    """
+
+    def __init__(
+        self,
+        expire: Expire,
+        *,
+        window: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._expire = expire
+        self._window = window
+        self._clock = clock
+        self._heap: List[Tuple[float, int, int]] = []
+        self._deadlines: Dict[Tuple[int, int], float] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, guild_id: int, rule_id: int, deadline: float) -> None:
+        self._deadlines[(guild_id, rule_id)] = deadline
+        heapq.heappush(self._heap, (deadline, guild_id, rule_id))
+        if self._heap[0][0] == deadline:
+            self._wakeup.set()
+
+    def unschedule(self, guild_id: int, rule_id: int) -> None:
+        # The heap entry stays behind and is skipped when popped.
+        self._deadlines.pop((guild_id, rule_id), None)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _pop_due(self) -> Dict[int, List[int]]:
+        due: Dict[int, List[int]] = {}
+        cutoff = self._clock() + self._window
+        while self._heap and self._heap[0][0] <= cutoff:
+            deadline, guild_id, rule_id = heapq.heappop(self._heap)
+            if self._deadlines.get((guild_id, rule_id)) != deadline:
+                continue
+            del self._deadlines[(guild_id, rule_id)]
+            due.setdefault(guild_id, []).append(rule_id)
+        return due
+
+    async def _sleep(self) -> None:
+        self._wakeup.clear()
+        timeout = self._heap[0][0] - self._clock() if self._heap else None
+        if timeout is not None and timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            await self._sleep()
+            for guild_id, rule_ids in self._pop_due().items():
+                try:
+                    await self._expire(guild_id, rule_ids)
+                except Exception:
+                    log.exception("Failed to expire %d rules in guild %s", len(rule_ids), guild_id)
@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+from .retry import NETWORK_ERRORS
+from .validation import PayloadError
+
+log = logging.getLogger("red.automodseeder.jobs")
+
+# A running job is checkpointed every this many items or seconds, whichever first.
+CHECKPOINT_EVERY = 25
+CHECKPOINT_INTERVAL = 5.0
+
+QUEUED = "queued"
+RUNNING = "running"
+CANCELLED = "cancelled"
+SUSPENDED = "suspended"
+
+
+@dataclass
+class BatchJob:
+    """One create/purge/enableall run, persisted after every completed item.
+
+    ``items`` are rule IDs for purge/enableall and slot indexes for create,
+    filled in when the job starts (``prepared``) so queued jobs see the
+    state left by the jobs ahead of them. ``completed`` holds the rule IDs
+    each successful item produced.
+    """
+
+    guild_id: int
+    action: str
+    items: List[int] = field(default_factory=list)
+    params: Dict[str, Any] = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: secrets.token_hex(4))
+    created_at: float = field(default_factory=time.time)
+    prepared: bool = False
+    position: int = 0
+    success: int = 0
+    failed: int = 0
+    keywords: int = 0
+    note: str = ""
+    stopped: bool = False
+    completed: List[int] = field(default_factory=list)
+    state: str = QUEUED
+    produced: List[Any] = field(default_factory=list, repr=False)
+    progress: Optional["ProgressMessage"] = field(default=None, repr=False)
+
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def finished(self) -> bool:
+        return self.stopped or self.position >= len(self.items)
+
+    def cancel(self) -> None:
+        self.state = CANCELLED
+
+    def suspend(self) -> None:
+        if self.state != CANCELLED:
+            self.state = SUSPENDED
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "guild_id": self.guild_id,
+            "action": self.action,
+            "items": self.items,
+            "params": self.params,
+            "created_at": self.created_at,
+            "prepared": self.prepared,
+            "position": self.position,
+            "success": self.success,
+            "failed": self.failed,
+            "keywords": self.keywords,
+            "note": self.note,
+            "stopped": self.stopped,
+            "completed": self.completed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchJob":
+        return cls(
+            guild_id=data["guild_id"],
+            action=data["action"],
+            items=list(data["items"]),
+            params=dict(data.get("params", {})),
+            job_id=data["job_id"],
+            created_at=data.get("created_at", 0.0),
+            prepared=data.get("prepared", True),
+            position=data.get("position", 0),
+            success=data.get("success", 0),
+            failed=data.get("failed", 0),
+            keywords=data.get("keywords", 0),
+            note=data.get("note", ""),
+            stopped=data.get("stopped", False),
+            completed=list(data.get("completed", [])),
+        )
+
+
+Step = Callable[[int], Awaitable[Optional[int]]]
+Checkpoint = Callable[[BatchJob], Awaitable[None]]
+Runner = Callable[[BatchJob], Awaitable[Any]]
+
+
+class BatchExecutor:
+    """Drive a BatchJob item by item with shared error handling.
+
+    ``step`` returns the rule ID it produced, or None when the item was
+    skipped. Statuses listed in ``stop_notes`` end the batch with that note,
+    as does a payload the local validator rejects; any other HTTP or network
+    failure is counted and the batch moves on.
+
+    Checkpoints are group-committed: every ``every`` items or ``interval``
+    seconds, and once more when the run ends. Steps must therefore be safe
+    to repeat for the items after the last checkpoint.
+    """
+
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        *,
+        every: int = CHECKPOINT_EVERY,
+        interval: float = CHECKPOINT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._checkpoint = checkpoint
+        self._every = every
+        self._interval = interval
+        self._clock = clock
+
+    async def run(self, job: BatchJob, step: Step, stop_notes: Dict[int, str]) -> BatchJob:
+        pending = 0
+        last_checkpoint = self._clock()
+        try:
+            while not job.finished:
+                if job.state == CANCELLED:
+                    job.note = "취소됨"
+                    break
+                if job.state == SUSPENDED:
+                    break
+                item = job.items[job.position]
+                try:
+                    produced = await step(item)
+                except discord.HTTPException as exc:
+                    job.failed += 1
+                    note = stop_notes.get(getattr(exc, "status", None))
+                    if note:
+                        job.note = note
+                        job.stopped = True
+                except NETWORK_ERRORS:
+                    job.failed += 1
+                except PayloadError as exc:
+                    # Rejected before sending; every later item builds the same shape.
+                    job.failed += 1
+                    job.note = f"요청 검증 실패: {exc}"
+                    job.stopped = True
+                else:
+                    if produced is not None:
+                        job.success += 1
+                        job.completed.append(produced)
+                job.position += 1
+                pending += 1
+                if pending >= self._every or self._clock() - last_checkpoint >= self._interval:
+                    await self._checkpoint(job)
+                    pending = 0
+                    last_checkpoint = self._clock()
+                if job.progress is not None:
+                    await job.progress.update(job)
+        finally:
+            if pending:
+                await self._checkpoint(job)
+        return job
+
+
+class ProgressMessage:
+    """A single status message per job, edited at most every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        message: discord.Message,
+        render: Callable[[BatchJob], str],
+        *,
+        interval: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.message = message
+        self._render = render
+        self._interval = interval
+        self._clock = clock
+        self._last_edit = clock()
+
+    async def update(self, job: BatchJob) -> None:
+        if self._clock() - self._last_edit < self._interval:
+            return
+        await self.set(self._render(job))
+
+    async def set(self, content: str) -> None:
+        self._last_edit = self._clock()
+        try:
+            await self.message.edit(content=content)
+        except discord.HTTPException:
+            pass
+
+
+class JobQueue:
+    """One FIFO queue and worker per guild.
+
+    Jobs for the same guild run one at a time; different guilds run in
+    parallel. A guild's worker exits once its queue drains, so idle guilds
+    cost nothing.
+    """
+
+    def __init__(self, runner: Runner) -> None:
+        self._runner = runner
+        self._queues: Dict[int, "asyncio.Queue[BatchJob]"] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._futures: Dict[str, asyncio.Future] = {}
+        self.jobs: Dict[str, BatchJob] = {}
+        self._closed = False
+
+    def submit(self, job: BatchJob) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._futures[job.job_id] = future
+        self.jobs[job.job_id] = job
+        self._queues.setdefault(job.guild_id, asyncio.Queue()).put_nowait(job)
+        worker = self._workers.get(job.guild_id)
+        if worker is None or worker.done():
+            self._workers[job.guild_id] = asyncio.create_task(self._work(job.guild_id))
+        return future
+
+    def guild_jobs(self, guild_id: int) -> List[BatchJob]:
+        return [job for job in self.jobs.values() if job.guild_id == guild_id]
+
+    def cancel(self, job_id: str) -> Optional[BatchJob]:
+        job = self.jobs.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+    async def _work(self, guild_id: int) -> None:
+        queue = self._queues[guild_id]
+        while not self._closed:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            future = self._futures.pop(job.job_id)
+            try:
+                if job.state == QUEUED:
+                    job.state = RUNNING
+                result = await self._runner(job)
+            except Exception as exc:
+                log.exception("Job %s failed in guild %s", job.job_id, guild_id)
+                if not future.done():
+                    future.set_exception(exc)
+                    # Commands don't await their futures; keep asyncio quiet.
+                    future.exception()
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.jobs.pop(job.job_id, None)
+        self._workers.pop(guild_id, None)
+        if queue.empty():
+            self._queues.pop(guild_id, None)
+
+    async def close(self, grace: float = 5.0) -> None:
+        """Suspend running jobs after their current item, then stop the workers."""
+        self._closed = True
+        for job in self.jobs.values():
+            job.suspend()
+        workers = list(self._workers.values())
+        if workers:
+            _, pending = await asyncio.wait(workers, timeout=grace)
+            for task in pending:
+                task.cancel()
+            # Let cancelled jobs unwind (journal, leases) before the caller closes them.
+            await asyncio.gather(*pending, return_exceptions=True)
+        for future in self._futures.values():
+            future.cancel()
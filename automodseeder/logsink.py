@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List
+
+import discord
+
+log = logging.getLogger("red.automodseeder.logsink")
+
+# Discord accepts at most 10 embeds per message.
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+@dataclass
+class LogRecord:
+    guild_id: int
+    action: str
+    requested: int
+    success: int
+    failed: int
+    note: str = ""
+    runs: int = 1
+    created_at: float = field(default_factory=time.time)
+
+    def merge(self, other: "LogRecord") -> None:
+        self.requested += other.requested
+        self.success += other.success
+        self.failed += other.failed
+        self.runs += other.runs
+        self.note = other.note or self.note
+
+
+@dataclass
+class _Pending:
+    records: List[LogRecord] = field(default_factory=list)
+    dropped: int = 0
+
+
+Resolver = Callable[[int, int], Any]
+Renderer = Callable[[LogRecord], discord.Embed]
+
+
+class LogAggregator:
+    """Queues report records per log channel and sends them in batches.
+
+    ``submit`` never awaits, so reporting cannot slow the operation being
+    reported. A channel's queue is flushed ``window`` seconds after its first
+    record, or as soon as it holds a full message of embeds. When a channel
+    holds ``max_pending`` records, records for the same guild and action are
+    merged; if that frees nothing, the oldest record is dropped and counted.
+    """
+
+    def __init__(
+        self,
+        resolve: Resolver,
+        render: Renderer,
+        *,
+        window: float = 5.0,
+        max_pending: int = 100,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._resolve = resolve
+        self._render = render
+        self._window = window
+        self._max_pending = max_pending
+        self._sleep = sleep
+        self._pending: Dict[int, _Pending] = {}
+        self._guilds: Dict[int, int] = {}
+        self._channels: Dict[int, Any] = {}
+        self._timers: Dict[int, asyncio.Task] = {}
+        self._sends: set = set()
+        self.dropped = 0
+
+    def submit(self, channel_id: int, record: LogRecord) -> None:
+        self._guilds[channel_id] = record.guild_id
+        pending = self._pending.setdefault(channel_id, _Pending())
+        if len(pending.records) >= self._max_pending:
+            self._make_room(pending)
+        pending.records.append(record)
+        if len(pending.records) >= MAX_EMBEDS_PER_MESSAGE:
+            self._cancel_timer(channel_id)
+            self._spawn(self.flush(channel_id))
+        elif channel_id not in self._timers:
+            self._timers[channel_id] = asyncio.create_task(self._flush_later(channel_id))
+
+    def _make_room(self, pending: _Pending) -> None:
+        merged: Dict[tuple, LogRecord] = {}
+        for record in pending.records:
+            key = (record.guild_id, record.action)
+            if key in merged:
+                merged[key].merge(record)
+            else:
+                merged[key] = record
+        pending.records = list(merged.values())
+        if len(pending.records) >= self._max_pending:
+            pending.records.pop(0)
+            pending.dropped += 1
+            self.dropped += 1
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    def _cancel_timer(self, channel_id: int) -> None:
+        timer = self._timers.pop(channel_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+    async def _flush_later(self, channel_id: int) -> None:
+        await self._sleep(self._window)
+        self._timers.pop(channel_id, None)
+        await self.flush(channel_id)
+
+    def _channel(self, channel_id: int) -> Any:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._resolve(self._guilds[channel_id], channel_id)
+            if channel is not None:
+                self._channels[channel_id] = channel
+        return channel
+
+    async def flush(self, channel_id: int) -> None:
+        pending = self._pending.pop(channel_id, None)
+        if pending is None or not pending.records:
+            return
+        channel = self._channel(channel_id)
+        if channel is None:
+            return
+        records = pending.records
+        for start in range(0, len(records), MAX_EMBEDS_PER_MESSAGE):
+            embeds = [self._render(record) for record in records[start : start + MAX_EMBEDS_PER_MESSAGE]]
+            if pending.dropped and start + MAX_EMBEDS_PER_MESSAGE >= len(records):
+                embeds[-1].set_footer(text=f"대기열 초과로 기록 {pending.dropped}개 생략")
+            try:
+                await channel.send(embeds=embeds)
+            except (discord.Forbidden, discord.NotFound):
+                # Channel gone or no access: re-resolve next time, skip this batch.
+                self._channels.pop(channel_id, None)
+                return
+            except discord.HTTPException:
+                log.warning("Failed to send %d log embeds to channel %s", len(embeds), channel_id)
+
+    async def close(self) -> None:
+        for channel_id in list(self._timers):
+            self._cancel_timer(channel_id)
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+        for channel_id in list(self._pending):
+            await self.flush(channel_id)
@@ -0,0 +1,204 @@
+"""Offline keyword matching with AutoMod's ``keyword_filter`` semantics.
+
+Every keyword of every rule is compiled into one Aho-Corasick automaton, so
+a message is scanned once no matter how many keywords the guild holds.
+Wildcards follow Discord: ``cat`` matches the whole word only, ``cat*``
+words starting with it, ``*cat`` words ending with it and ``*cat*``
+anywhere. Matching is case-insensitive.
+
+    python -m automodseeder.matcher                     # scale 100/1k/10k keywords
+    python -m automodseeder.matcher --corpus messages.txt --keywords 6000
+"""
+import argparse
+import json
+import random
+import secrets
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+
+DEFAULT_KEYWORD_COUNTS = (100, 1000, 10000)
+DEFAULT_MESSAGES = 20000
+
+
+class _Pattern(NamedTuple):
+    length: int
+    # Whether the match may start/end inside a word (a leading/trailing ``*``).
+    prefix_wild: bool
+    suffix_wild: bool
+    rule_ids: Tuple[int, ...]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """Which rules' keyword filters a message trips.
+
+    Build with ``KeywordMatcher(rules)`` where ``rules`` maps rule IDs to
+    their ``keyword_filter`` lists; ``build_seconds`` records how long the
+    automaton took to compile.
+    """
+
+    def __init__(self, rules: Mapping[int, Iterable[str]]) -> None:
+        started = time.perf_counter()
+        owners: Dict[Tuple[str, bool, bool], Set[int]] = {}
+        for rule_id, keywords in rules.items():
+            for keyword in keywords:
+                core = keyword.strip("*").lower()
+                if core:
+                    key = (core, keyword.startswith("*"), keyword.endswith("*"))
+                    owners.setdefault(key, set()).add(rule_id)
+        self.keyword_count = len(owners)
+        self.rule_count = len(rules)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[_Pattern, ...]] = [()]
+        for (core, prefix_wild, suffix_wild), rule_ids in owners.items():
+            state = 0
+            for char in core:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = nxt
+            pattern = _Pattern(len(core), prefix_wild, suffix_wild, tuple(sorted(rule_ids)))
+            self._output[state] += (pattern,)
+        self._link()
+        self.build_seconds = time.perf_counter() - started
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Fold the fail chain's matches in so the scan never walks it.
+                self._output[nxt] += self._output[self._fail[nxt]]
+
+    def match(self, text: str) -> Set[int]:
+        """Return the IDs of every rule with a keyword that matches ``text``."""
+        text = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        matched: Set[int] = set()
+        state = 0
+        last = len(text) - 1
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                if not pattern.prefix_wild:
+                    start = end - pattern.length + 1
+                    if start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                if not pattern.suffix_wild and end < last and _is_word_char(text[end + 1]):
+                    continue
+                matched.update(pattern.rule_ids)
+        return matched
+
+
+class CorpusReport(NamedTuple):
+    messages: int
+    matched_messages: int
+    hits: Counter
+    seconds: float
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.messages / self.seconds if self.seconds else 0.0
+
+
+def run_corpus(matcher: KeywordMatcher, messages: Iterable[str]) -> CorpusReport:
+    """Match every message; ``hits`` counts matched messages per rule ID."""
+    hits: Counter = Counter()
+    count = matched = 0
+    started = time.perf_counter()
+    for message in messages:
+        count += 1
+        rule_ids = matcher.match(message)
+        if rule_ids:
+            matched += 1
+            hits.update(rule_ids)
+    return CorpusReport(count, matched, hits, time.perf_counter() - started)
+
+
+# ---------------------
+# Scaling benchmark
+# ---------------------
+def _random_rules(keyword_count: int, rng: random.Random) -> Dict[int, List[str]]:
+    # Seed-style keywords, 1000 per rule like ``pack``, with a share of wildcards.
+    rules: Dict[int, List[str]] = {}
+    for index in range(keyword_count):
+        keyword = f"amseed_{rng.getrandbits(40):010x}"
+        shape = rng.random()
+        if shape < 0.1:
+            keyword += "*"
+        elif shape < 0.2:
+            keyword = "*" + keyword
+        rules.setdefault(1000 + index // 1000, []).append(keyword)
+    return rules
+
+
+def _random_messages(rules: Mapping[int, List[str]], count: int, rng: random.Random) -> List[str]:
+    keywords = [keyword.strip("*") for values in rules.values() for keyword in values]
+    messages = []
+    for _ in range(count):
+        words = [secrets.token_hex(rng.randint(2, 6)) for _ in range(rng.randint(5, 20))]
+        if keywords and rng.random() < 0.05:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        messages.append(" ".join(words))
+    return messages
+
+
+def benchmark(
+    keyword_counts: Sequence[int], corpus: Optional[List[str]] = None, *, seed: int = 0
+) -> List[Dict[str, float]]:
+    rng = random.Random(seed)
+    rows = []
+    for keyword_count in keyword_counts:
+        rules = _random_rules(keyword_count, rng)
+        matcher = KeywordMatcher(rules)
+        messages = corpus if corpus is not None else _random_messages(rules, DEFAULT_MESSAGES, rng)
+        report = run_corpus(matcher, messages)
+        rows.append(
+            {
+                "keywords": matcher.keyword_count,
+                "states": matcher.state_count,
+                "build_ms": round(matcher.build_seconds * 1000, 2),
+                "messages": report.messages,
+                "matched": report.matched_messages,
+                "messages_per_second": round(report.messages_per_second),
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keywords", type=int, nargs="+", default=list(DEFAULT_KEYWORD_COUNTS))
+    parser.add_argument("--corpus", type=Path, default=None, help="one message per line")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    corpus = None
+    if args.corpus is not None:
+        corpus = args.corpus.read_text(encoding="utf-8").splitlines()
+    print(json.dumps(benchmark(args.keywords, corpus, seed=args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
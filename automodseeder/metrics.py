@@ -0,0 +1,123 @@
+import math
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Sequence, Tuple
+
+import discord
+
+from .retry import NETWORK_ERRORS
+
+# Upper bounds in seconds, Prometheus style; +Inf is implied.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return math.inf
+
+
+class Metrics:
+    """In-process counters for the REST hot path.
+
+    ``request`` times one API call per operation name and counts its outcome
+    by status (``2xx`` on success, the HTTP status on error, ``network`` for
+    timeouts/connection errors). Waits are accumulated separately so time
+    spent pacing is not mistaken for Discord latency.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.latency: Dict[str, Histogram] = {}
+        self.statuses: Counter = Counter()
+        self.ratelimit_wait = 0.0
+        self.retry_sleep = 0.0
+        self.config_reads = 0
+        self.config_writes = 0
+        self.started_at = time.time()
+
+    @asynccontextmanager
+    async def request(self, operation: str) -> AsyncIterator[None]:
+        started = self._clock()
+        status = "2xx"
+        try:
+            yield
+        except discord.HTTPException as exc:
+            status = str(exc.status)
+            raise
+        except NETWORK_ERRORS:
+            status = "network"
+            raise
+        finally:
+            self.latency.setdefault(operation, Histogram()).observe(self._clock() - started)
+            self.statuses[(operation, status)] += 1
+
+    def render_prometheus(
+        self,
+        *,
+        config_reads: int = 0,
+        config_writes: int = 0,
+        cache_hits: int = 0,
+        cache_misses: int = 0,
+    ) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = [
+            "# HELP automodseeder_request_duration_seconds AutoMod REST call latency.",
+            "# TYPE automodseeder_request_duration_seconds histogram",
+        ]
+        for operation, histogram in sorted(self.latency.items()):
+            for bound, total in histogram.cumulative():
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(
+                    f'automodseeder_request_duration_seconds_bucket{{op="{operation}",le="{le}"}} {total}'
+                )
+            lines.append(f'automodseeder_request_duration_seconds_sum{{op="{operation}"}} {histogram.sum:.6f}')
+            lines.append(f'automodseeder_request_duration_seconds_count{{op="{operation}"}} {histogram.count}')
+        lines += [
+            "# HELP automodseeder_requests_total AutoMod REST calls by outcome.",
+            "# TYPE automodseeder_requests_total counter",
+        ]
+        for (operation, status), count in sorted(self.statuses.items()):
+            lines.append(f'automodseeder_requests_total{{op="{operation}",status="{status}"}} {count}')
+        counters = (
+            ("ratelimit_wait_seconds_total", "Time spent waiting for rate-limit buckets.", f"{self.ratelimit_wait:.6f}"),
+            ("retry_sleep_seconds_total", "Time spent in retry backoff.", f"{self.retry_sleep:.6f}"),
+            ("config_reads_total", "Config reads issued by the cog.", str(self.config_reads + config_reads)),
+            ("config_writes_total", "Config writes issued by the cog.", str(self.config_writes + config_writes)),
+            ("rule_cache_hits_total", "Rule lookups served from the rule cache.", str(cache_hits)),
+            ("rule_cache_misses_total", "Rule lookups that needed a REST fetch.", str(cache_misses)),
+        )
+        for name, help_text, value in counters:
+            lines += [
+                f"# HELP automodseeder_{name} {help_text}",
+                f"# TYPE automodseeder_{name} counter",
+                f"automodseeder_{name} {value}",
+            ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Any, List
+
+
+@dataclass
+class OperationResult:
+    guild_id: int
+    action: str
+    requested: int = 0
+    success: int = 0
+    failed: int = 0
+    skipped: int = 0
+    note: str = ""
+    stopped: bool = False
+    keywords: int = 0
+    created: List[Any] = field(default_factory=list)
@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+OP_CREATE = 0
+OP_PATCH = 1
+OP_DELETE = 2
+
+TRIGGER_TYPE_KEYWORD = 1
+TRIGGER_TYPE_SPAM = 3
+TRIGGER_TYPE_KEYWORD_PRESET = 4
+TRIGGER_TYPE_MENTION_SPAM = 5
+TRIGGER_TYPE_MEMBER_PROFILE = 6
+
+TRIGGER_TYPE_NAMES = {
+    TRIGGER_TYPE_KEYWORD: "keyword",
+    TRIGGER_TYPE_SPAM: "spam",
+    TRIGGER_TYPE_KEYWORD_PRESET: "keyword_preset",
+    TRIGGER_TYPE_MENTION_SPAM: "mention_spam",
+    TRIGGER_TYPE_MEMBER_PROFILE: "member_profile",
+}
+
+# Documented number of rules of each trigger type a guild may hold.
+RULE_CAPS = {
+    TRIGGER_TYPE_KEYWORD: 6,
+    TRIGGER_TYPE_SPAM: 1,
+    TRIGGER_TYPE_KEYWORD_PRESET: 1,
+    TRIGGER_TYPE_MENTION_SPAM: 1,
+    TRIGGER_TYPE_MEMBER_PROFILE: 1,
+}
+
+
+@dataclass
+class DesiredState:
+    rules: int
+    keywords: Optional[int]
+    enabled: bool
+    action_mode: str
+
+
+@dataclass
+class RuleView:
+    rule_id: int
+    enabled: bool
+    keyword_count: int
+    action_mode: str
+
+
+@dataclass
+class Plan:
+    """Minimal set of writes that turns the current seeded rules into the desired state.
+
+    ``patches`` maps rule IDs to the fields that differ: ``enabled``,
+    ``keyword_count`` and/or ``action_mode``.
+    """
+
+    creates: int = 0
+    patches: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    deletes: List[int] = field(default_factory=list)
+    capacity: Optional["CapacityPlan"] = None
+
+    @property
+    def api_calls(self) -> int:
+        return self.creates + len(self.patches) + len(self.deletes)
+
+    def operations(self) -> List[List[int]]:
+        """Flatten into ``[kind, rule_id]`` pairs; deletes first to free rule slots."""
+        ops = [[OP_DELETE, rule_id] for rule_id in self.deletes]
+        ops.extend([OP_PATCH, rule_id] for rule_id in self.patches)
+        ops.extend([OP_CREATE, 0] for _ in range(self.creates))
+        return ops
+
+
+def plan_changes(current: List[RuleView], desired: DesiredState) -> Plan:
+    plan = Plan()
+    keep = current[: desired.rules]
+    plan.deletes = [view.rule_id for view in current[desired.rules :]]
+    plan.creates = max(0, desired.rules - len(current))
+    for view in keep:
+        changes: Dict[str, Any] = {}
+        if view.enabled != desired.enabled:
+            changes["enabled"] = desired.enabled
+        if desired.keywords is not None and view.keyword_count != desired.keywords:
+            changes["keyword_count"] = desired.keywords
+        if view.action_mode != desired.action_mode:
+            changes["action_mode"] = desired.action_mode
+        if changes:
+            plan.patches[view.rule_id] = changes
+    return plan
+
+
+@dataclass
+class CapacityPlan:
+    """How many rules of one trigger type can still be created in a guild."""
+
+    trigger_type: int
+    requested: int
+    existing: int
+    cap: int
+
+    @property
+    def feasible(self) -> int:
+        return max(0, min(self.requested, self.cap - self.existing))
+
+    @property
+    def skipped(self) -> int:
+        return self.requested - self.feasible
+
+    def describe(self) -> str:
+        name = TRIGGER_TYPE_NAMES.get(self.trigger_type, str(self.trigger_type))
+        return (
+            f"요청 {self.requested}개 중 {self.feasible}개 생성 가능 "
+            f"({name} 규칙 {self.existing}/{self.cap}개 사용 중)"
+        )
+
+
+def plan_capacity(
+    trigger_types: Iterable[int],
+    trigger_type: int,
+    requested: int,
+    *,
+    freed: int = 0,
+    caps: Mapping[int, int] = RULE_CAPS,
+) -> CapacityPlan:
+    """Count the guild's rules of ``trigger_type`` against its cap.
+
+    ``trigger_types`` holds one entry per existing rule in the guild (seeded
+    or not); ``freed`` is how many of them the same plan deletes first.
+    """
+    existing = sum(1 for value in trigger_types if value == trigger_type)
+    return CapacityPlan(trigger_type, requested, max(0, existing - freed), caps.get(trigger_type, 0))
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Mapping, Optional
+
+
+@dataclass
+class BucketState:
+    bucket: Optional[str] = None
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+class RateLimitScheduler:
+    """Per-route bucket tracker that only waits as long as Discord says.
+
+    Buckets are keyed like discord.py does: ``"{route_key}:{major_parameters}"``,
+    re-keyed onto the server's bucket hash once it is known so routes that
+    share a bucket also share their budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._hashes: Dict[str, str] = {}
+        self._buckets: Dict[str, BucketState] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._global_reset_at = 0.0
+        self.waited_seconds = 0.0
+
+    def bucket_key(self, route_key: str, major: str) -> str:
+        return f"{self._hashes.get(route_key, route_key)}:{major}"
+
+    def state(self, route_key: str, major: str) -> Optional[BucketState]:
+        return self._buckets.get(self.bucket_key(route_key, major))
+
+    def reset_after(self, state: BucketState) -> float:
+        return max(0.0, state.reset_at - self._clock())
+
+    def delay_for(self, route_key: str, major: str) -> float:
+        now = self._clock()
+        delay = max(0.0, self._global_reset_at - now)
+        state = self.state(route_key, major)
+        if state and state.remaining is not None and state.remaining <= 0:
+            delay = max(delay, state.reset_at - now)
+        return delay
+
+    async def acquire(self, route_key: str, major: str) -> float:
+        """Wait until the bucket has budget, then reserve one request from it."""
+        key = self.bucket_key(route_key, major)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            delay = self.delay_for(route_key, major)
+            if delay > 0:
+                await self._sleep(delay)
+                self.waited_seconds += delay
+            state = self._buckets.get(key)
+            if state and state.remaining is not None:
+                if state.reset_at <= self._clock():
+                    state.remaining = state.limit
+                if state.remaining is not None:
+                    state.remaining -= 1
+        return delay
+
+    def update(
+        self,
+        route_key: str,
+        major: str,
+        *,
+        remaining: Optional[int],
+        reset_after: Optional[float],
+        bucket: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> None:
+        if bucket:
+            self._hashes[route_key] = bucket
+        key = self.bucket_key(route_key, major)
+        state = self._buckets.setdefault(key, BucketState())
+        state.bucket = bucket or state.bucket
+        if limit is not None:
+            state.limit = limit
+        if remaining is not None:
+            state.remaining = remaining
+        if reset_after is not None:
+            state.reset_at = self._clock() + max(0.0, reset_after)
+
+    def update_from_headers(
+        self,
+        route_key: str,
+        major: str,
+        headers: Mapping[str, str],
+        retry_after: Optional[float] = None,
+    ) -> None:
+        remaining = _header(headers, "X-RateLimit-Remaining")
+        reset_after = _header(headers, "X-RateLimit-Reset-After")
+        limit = _header(headers, "X-RateLimit-Limit")
+        if retry_after is None:
+            raw_retry = _header(headers, "Retry-After")
+            retry_after = float(raw_retry) if raw_retry is not None else None
+        is_global = (_header(headers, "X-RateLimit-Global") or "").lower() == "true"
+        if is_global and retry_after is not None:
+            self.set_global(retry_after)
+            return
+        if remaining is None and retry_after is None:
+            return
+        self.update(
+            route_key,
+            major,
+            remaining=0 if retry_after is not None else int(remaining),
+            reset_after=retry_after if retry_after is not None else float(reset_after or 0),
+            bucket=_header(headers, "X-RateLimit-Bucket"),
+            limit=int(limit) if limit is not None else None,
+        )
+
+    def set_global(self, retry_after: float) -> None:
+        self._global_reset_at = max(self._global_reset_at, self._clock() + retry_after)
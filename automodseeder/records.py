@@ -0,0 +1,127 @@
+"""Compact AutoMod rule records decoded straight from REST JSON.
+
+The cog only reads a rule's ID, name, enabled flag, trigger type, keyword
+list and action types, so it keeps ``RuleRecord`` objects instead of full
+``discord.AutoModRule`` instances. Rules discord.py hands us in gateway
+events are converted with ``RuleRecord.from_rule``.
+
+    python -m automodseeder.records --rules 1000 --keywords 100
+"""
+import argparse
+import json
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+class RuleRecord:
+    __slots__ = ("id", "name", "enabled", "trigger_type", "keyword_filter", "action_types")
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        enabled: bool,
+        trigger_type: int,
+        keyword_filter: Sequence[str] = (),
+        action_types: Tuple[int, ...] = (),
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.enabled = enabled
+        self.trigger_type = trigger_type
+        self.keyword_filter = keyword_filter
+        self.action_types = action_types
+
+    def __repr__(self) -> str:
+        return f"<RuleRecord id={self.id} name={self.name!r} enabled={self.enabled}>"
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> "RuleRecord":
+        metadata = data.get("trigger_metadata") or {}
+        return cls(
+            int(data["id"]),
+            data["name"],
+            bool(data.get("enabled", False)),
+            data["trigger_type"],
+            # The decoded list is kept as-is; copying it would double the keyword storage.
+            metadata.get("keyword_filter") or (),
+            tuple(action["type"] for action in data.get("actions") or ()),
+        )
+
+    @classmethod
+    def from_rule(cls, rule: Any) -> "RuleRecord":
+        """Convert a ``discord.AutoModRule``."""
+        trigger_type = rule.trigger.type
+        return cls(
+            rule.id,
+            rule.name,
+            rule.enabled,
+            getattr(trigger_type, "value", trigger_type),
+            getattr(rule.trigger, "keyword_filter", None) or (),
+            tuple(getattr(action.type, "value", action.type) for action in rule.actions),
+        )
+
+
+# ---------------------
+# Decode micro-benchmark
+# ---------------------
+def _rule_data(index: int, keywords: int) -> Dict[str, Any]:
+    return {
+        "id": str(1_100_000_000_000_000_000 + index),
+        "guild_id": "1000",
+        "name": f"[AMSEED] seed {index:08x}",
+        "creator_id": "1",
+        "event_type": 1,
+        "trigger_type": 1,
+        "trigger_metadata": {
+            "keyword_filter": [f"amseed_1000_{index:06x}{n:06x}" for n in range(keywords)],
+            "regex_patterns": [],
+            "allow_list": [],
+        },
+        "actions": [{"type": 1, "metadata": {"custom_message": "seed"}}],
+        "enabled": False,
+        "exempt_roles": [],
+        "exempt_channels": [],
+    }
+
+
+def _measure(decode: Callable[[Dict[str, Any]], Any], data: List[Dict[str, Any]]) -> Dict[str, float]:
+    seconds = min(timeit.repeat(lambda: [decode(rule) for rule in data], number=1, repeat=5))
+    tracemalloc.start()
+    decoded = [decode(rule) for rule in data]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    per_thousand = 1000 / len(data)
+    return {
+        "decode_ms_per_1000": round(seconds * 1000 * per_thousand, 3),
+        "kib_per_1000": round(retained / 1024 * per_thousand, 1),
+    }
+
+
+def benchmark(rules: int, keywords: int) -> Dict[str, Any]:
+    import discord
+
+    # Decoded from JSON text so keyword strings are shared the way a REST response's are.
+    data = json.loads(json.dumps([_rule_data(index, keywords) for index in range(rules)]))
+    guild = SimpleNamespace(id=1000)
+    report: Dict[str, Any] = {"rules": rules, "keywords_per_rule": keywords}
+    report["AutoModRule"] = _measure(
+        lambda rule: discord.AutoModRule(data=rule, guild=guild, state=None), data
+    )
+    report["RuleRecord"] = _measure(RuleRecord.from_data, data)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=1000)
+    parser.add_argument("--keywords", type=int, default=3)
+    args = parser.parse_args(argv)
+    print(json.dumps(benchmark(args.rules, args.keywords), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import aiohttp
+import discord
+
+T = TypeVar("T")
+
+NETWORK_ERRORS = (asyncio.TimeoutError, aiohttp.ClientError)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    batch_budget: int = 20
+
+    def backoff(self, attempt: int) -> float:
+        # "Full jitter": uniform over the capped exponential window.
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class RetryBudget:
+    """Retries shared by every operation of one batch."""
+
+    def __init__(self, total: int) -> None:
+        self.remaining = total
+        self.used = 0
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        self.used += 1
+        return True
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        value = headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(exc: BaseException, attempt: int, policy: RetryPolicy) -> Optional[float]:
+    """Return how long to wait before retrying ``exc``, or None if it is final."""
+    if isinstance(exc, NETWORK_ERRORS):
+        return policy.backoff(attempt)
+    if isinstance(exc, discord.Forbidden) or isinstance(exc, discord.NotFound):
+        return None
+    if isinstance(exc, discord.HTTPException):
+        status = getattr(exc, "status", None)
+        if status == 429:
+            delay = retry_after(exc)
+            return policy.backoff(attempt) if delay is None else delay
+        if status is not None and status >= 500:
+            return policy.backoff(attempt)
+    return None
+
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    budget: Optional[RetryBudget] = None,
+    *,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> T:
+    attempt = 0
+    while True:
+        try:
+            return await func()
+        except (discord.HTTPException, *NETWORK_ERRORS) as exc:
+            attempt += 1
+            delay = retry_delay(exc, attempt - 1, policy)
+            if delay is None or attempt >= policy.max_attempts:
+                raise
+            if budget is not None and not budget.take():
+                raise
+            await sleep(delay)
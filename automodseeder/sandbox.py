@@ -0,0 +1,148 @@
+"""Minimal bot, guild and command context for running the cog outside Discord.
+
+``Sandbox`` points Red's data manager at a temporary directory (the same way
+Red's own pytest fixtures do), loads ``AutoModSeeder`` against the given HTTP
+client and tears everything down on exit. Every Config write that reaches the
+driver is counted in ``config_writes``.
+"""
+import shutil
+import tempfile
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from redbot.core import _drivers, data_manager
+
+SANDBOX_OWNER_ID = 1448530688558235719
+
+
+class SandboxGuild:
+    def __init__(self, guild_id: int, *, manage_guild: bool = True) -> None:
+        self.id = guild_id
+        self.name = f"sandbox-{guild_id}"
+        self.me = SimpleNamespace(guild_permissions=SimpleNamespace(manage_guild=manage_guild))
+        self.channels: Dict[int, Any] = {}
+
+    def get_channel(self, channel_id: int) -> Any:
+        return self.channels.get(channel_id)
+
+    def get_member(self, user_id: int) -> Any:
+        return self.me
+
+
+class SandboxBot:
+    def __init__(self, http: Any, guild_ids: Iterable[int]) -> None:
+        self.http = http
+        self.user = SimpleNamespace(id=1)
+        self.guilds: List[SandboxGuild] = [SandboxGuild(guild_id) for guild_id in guild_ids]
+
+    def get_guild(self, guild_id: int) -> Optional[SandboxGuild]:
+        return next((guild for guild in self.guilds if guild.id == guild_id), None)
+
+    async def is_owner(self, user: Any) -> bool:
+        return user.id == SANDBOX_OWNER_ID
+
+    async def wait_until_red_ready(self) -> None:
+        return None
+
+
+class SandboxMessage:
+    def __init__(self, channel: "SandboxContext", content: Optional[str]) -> None:
+        self.channel = channel
+        self.content = content
+
+    async def edit(self, *, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.content = content
+        self.channel.sent.append(content)
+
+
+class SandboxContext:
+    """Just enough of ``commands.Context`` to invoke command callbacks directly."""
+
+    def __init__(self, bot: SandboxBot, guild: SandboxGuild, *, author_id: int = SANDBOX_OWNER_ID) -> None:
+        self.bot = bot
+        self.guild = guild
+        self.author = SimpleNamespace(id=author_id)
+        self.sent: List[Optional[str]] = []
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> SandboxMessage:
+        self.sent.append(content)
+        return SandboxMessage(self, content)
+
+    def typing(self) -> "SandboxContext":
+        return self
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class Sandbox:
+    """Load the cog against ``http`` with fresh, temporary Red data.
+
+    With ``persist=False`` Config writes stay in the driver's memory instead of
+    going through its executor-backed file save. ``configure`` runs on the cog
+    before ``cog_load``.
+    """
+
+    def __init__(
+        self,
+        http: Any,
+        guild_ids: Iterable[int],
+        *,
+        persist: bool = True,
+        configure: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.bot = SandboxBot(http, guild_ids)
+        self.cog = None
+        self.config_writes = 0
+        self._persist = persist
+        self._configure = configure
+        self._data_path: Optional[str] = None
+        self._previous_config: Optional[Dict[str, Any]] = None
+
+    @property
+    def guilds(self) -> List[SandboxGuild]:
+        return self.bot.guilds
+
+    def context(self, guild: SandboxGuild) -> SandboxContext:
+        return SandboxContext(self.bot, guild)
+
+    async def __aenter__(self) -> "Sandbox":
+        from .automodseeder import AutoModSeeder
+
+        self._data_path = tempfile.mkdtemp(prefix="automodseeder-")
+        self._previous_config = data_manager.basic_config
+        data_manager.basic_config = dict(
+            data_manager.basic_config_default,
+            DATA_PATH=self._data_path,
+            STORAGE_TYPE="JSON",
+            STORAGE_DETAILS={},
+        )
+        await _drivers.JsonDriver.initialize()
+        self.cog = AutoModSeeder(self.bot)
+        self._count_writes(self.cog.config._driver)
+        if self._configure is not None:
+            self._configure(self.cog)
+        await self.cog.cog_load()
+        return self
+
+    def _count_writes(self, driver: Any) -> None:
+        save = driver._save
+
+        async def counted_save() -> None:
+            self.config_writes += 1
+            if self._persist:
+                await save()
+
+        driver._save = counted_save
+
+    async def __aexit__(self, *exc: Any) -> None:
+        try:
+            if self.cog is not None:
+                await self.cog.cog_unload()
+            await _drivers.JsonDriver.teardown()
+        finally:
+            data_manager.basic_config = self._previous_config
+            shutil.rmtree(self._data_path, ignore_errors=True)
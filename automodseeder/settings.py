@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from redbot.core import Config
+
+log = logging.getLogger("red.automodseeder.settings")
+
+# Job checkpoints are durability-critical and always written straight through
+# to Config; seeded_rule_ids is only read once by the seed store migration.
+UNCACHED_KEYS = frozenset({"seeded_rule_ids", "jobs"})
+
+
+class SettingsCache:
+    """Per-guild snapshot of the guild Config group with write-behind updates.
+
+    The first read loads the whole group with one ``all()`` call; later reads
+    are plain dict lookups. ``set`` updates the snapshot immediately and
+    queues the value, so repeated writes to a key within ``flush_delay``
+    collapse into a single Config write.
+
+    Snapshots are never reloaded, so every write to a cached key must go
+    through ``set``; writing one through ``Config`` directly would be
+    shadowed by the snapshot until the cog reloads.
+    """
+
+    def __init__(self, config: Config, *, flush_delay: float = 2.0) -> None:
+        self._config = config
+        self._flush_delay = flush_delay
+        self._snapshots: Dict[int, Dict[str, Any]] = {}
+        self._dirty: Dict[int, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.loads = 0
+        self.writes = 0
+
+    async def get(self, guild_id: int) -> Dict[str, Any]:
+        snapshot = self._snapshots.get(guild_id)
+        if snapshot is None:
+            data = await self._config.guild_from_id(guild_id).all()
+            self.loads += 1
+            snapshot = {key: value for key, value in data.items() if key not in UNCACHED_KEYS}
+            snapshot.update(self._dirty.get(guild_id, {}))
+            self._snapshots[guild_id] = snapshot
+        return snapshot
+
+    async def value(self, guild_id: int, key: str) -> Any:
+        return (await self.get(guild_id))[key]
+
+    def set(self, guild_id: int, key: str, value: Any) -> None:
+        snapshot = self._snapshots.get(guild_id)
+        if snapshot is not None:
+            snapshot[key] = value
+        self._dirty.setdefault(guild_id, {})[key] = value
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._dirty = self._dirty, {}
+        for guild_id, values in pending.items():
+            group = self._config.guild_from_id(guild_id)
+            for key, value in values.items():
+                try:
+                    await group.set_raw(key, value=value)
+                    self.writes += 1
+                except Exception:
+                    log.exception("Failed to write %s for guild %s", key, guild_id)
+
+    async def close(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
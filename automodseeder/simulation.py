@@ -0,0 +1,229 @@
+"""Virtual-clock benchmarks for the create/enableall/purge batch jobs.
+
+The cog runs in a ``Sandbox`` against an in-process ``AutoModEmulator`` on an
+event loop whose clock only moves when every task is waiting on a timer, so
+rate-limit waits, retry backoff and emulated latency finish instantly while
+the simulated makespan is still measured.
+
+    python -m automodseeder.simulation                 # print the report
+    python -m automodseeder.simulation --save-baseline # record a new baseline
+    python -m automodseeder.simulation --check         # exit 1 on regressions
+"""
+import argparse
+import asyncio
+import json
+import random
+import selectors
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, TypeVar
+
+from .cache import RuleCache
+from .coordination import SharedCoordinator
+from .emulator import AutoModEmulator, EmulatorOptions, loopback_http
+from .ratelimit import RateLimitScheduler
+from .sandbox import Sandbox
+
+T = TypeVar("T")
+
+DEFAULT_RULE_COUNTS = (10, 100, 1000)
+DEFAULT_GUILDS = 3
+PHASES = ("create", "enableall", "purge")
+BASELINE_PATH = Path(__file__).with_name("simulation_baseline.json")
+
+# Relative slack before a metric counts as a regression.
+MAKESPAN_TOLERANCE = 0.10
+CALLS_TOLERANCE = 0.0
+
+
+class _VirtualSelector:
+    """Polls the real selector, and jumps the clock instead of blocking on a timer."""
+
+    def __init__(self, selector: selectors.BaseSelector, loop: "VirtualClockLoop") -> None:
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None):
+        if timeout is None:
+            # No timers at all: only real I/O (e.g. an executor) can wake us.
+            return self._selector.select(None)
+        events = self._selector.select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self._virtual_time = 0.0
+        self._selector = _VirtualSelector(self._selector, self)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+
+def run_virtual(main: Awaitable[T]) -> T:
+    loop = VirtualClockLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+@dataclass
+class PhaseResult:
+    phase: str
+    rules: int
+    guilds: int
+    makespan: float
+    api_calls: int
+    rate_limited: int
+    config_writes: int
+    success: int
+    failed: int
+    ratelimit_wait: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.phase}:{self.rules}x{self.guilds}"
+
+
+def _options(rules: int, seed: int) -> EmulatorOptions:
+    # Lift the per-guild keyword rule cap (emulator and planner) so batches of
+    # any size can be paced.
+    options = EmulatorOptions(latency=0.05, jitter=0.05, seed=seed)
+    options.rule_caps[1] = max(options.rule_caps[1], rules)
+    return options
+
+
+async def run_scenario(rules: int, guild_count: int, *, seed: int = 0) -> List[PhaseResult]:
+    random.seed(seed)
+    loop = asyncio.get_running_loop()
+    options = _options(rules, seed)
+    emulator = AutoModEmulator(options, clock=loop.time)
+    guild_ids = [10_000 + index for index in range(guild_count)]
+    for guild_id in guild_ids:
+        emulator.add_guild(guild_id)
+
+    def configure(cog: Any) -> None:
+        cog.coordinator = SharedCoordinator(":memory:", clock=loop.time)
+        cog.rule_caps = dict(options.rule_caps)
+        cog.ratelimiter = RateLimitScheduler(clock=loop.time)
+        cog.rule_cache = RuleCache(cog.rule_cache.ttl, clock=loop.time)
+
+    results = []
+    http = loopback_http(emulator)
+    async with Sandbox(http, guild_ids, persist=False, configure=configure) as sandbox:
+        cog = sandbox.cog
+        runners = {
+            "create": lambda guild: cog._seed_guild(guild, rules, False),
+            "enableall": cog._enable_guild,
+            "purge": cog._purge_guild,
+        }
+        for phase in PHASES:
+            emulator.reset_stats()
+            writes = sandbox.config_writes
+            waited = cog.ratelimiter.waited_seconds
+            started = loop.time()
+            outcomes = await asyncio.gather(*(runners[phase](guild) for guild in sandbox.guilds))
+            results.append(
+                PhaseResult(
+                    phase=phase,
+                    rules=rules,
+                    guilds=guild_count,
+                    makespan=round(loop.time() - started, 3),
+                    api_calls=sum(emulator.calls.values()),
+                    rate_limited=emulator.statuses[429],
+                    config_writes=sandbox.config_writes - writes,
+                    success=sum(outcome.success for outcome in outcomes),
+                    failed=sum(outcome.failed for outcome in outcomes),
+                    ratelimit_wait=round(cog.ratelimiter.waited_seconds - waited, 3),
+                )
+            )
+    return results
+
+
+async def run_suite(rule_counts: Sequence[int], guild_count: int, *, seed: int = 0) -> List[PhaseResult]:
+    results: List[PhaseResult] = []
+    for rules in rule_counts:
+        results.extend(await run_scenario(rules, guild_count, seed=seed))
+    return results
+
+
+def find_regressions(results: Sequence[PhaseResult], baseline: Dict[str, Dict[str, Any]]) -> List[str]:
+    problems = []
+    for result in results:
+        expected = baseline.get(result.key)
+        if expected is None:
+            continue
+        if result.makespan > expected["makespan"] * (1 + MAKESPAN_TOLERANCE):
+            problems.append(f"{result.key}: makespan {expected['makespan']}s -> {result.makespan}s")
+        if result.api_calls > expected["api_calls"] * (1 + CALLS_TOLERANCE):
+            problems.append(f"{result.key}: API calls {expected['api_calls']} -> {result.api_calls}")
+        if result.rate_limited > expected["rate_limited"]:
+            problems.append(f"{result.key}: 429s {expected['rate_limited']} -> {result.rate_limited}")
+        if result.config_writes > expected["config_writes"] * (1 + CALLS_TOLERANCE):
+            problems.append(
+                f"{result.key}: Config writes {expected['config_writes']} -> {result.config_writes}"
+            )
+    return problems
+
+
+def format_report(results: Sequence[PhaseResult]) -> str:
+    header = f"{'scenario':<22}{'makespan(s)':>12}{'calls':>8}{'429s':>6}{'writes':>8}{'ok':>7}{'fail':>6}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.key:<22}{result.makespan:>12.1f}{result.api_calls:>8}{result.rate_limited:>6}"
+            f"{result.config_writes:>8}{result.success:>7}{result.failed:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, nargs="+", default=list(DEFAULT_RULE_COUNTS))
+    parser.add_argument("--guilds", type=int, default=DEFAULT_GUILDS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_virtual(run_suite(args.rules, args.guilds, seed=args.seed))
+    if args.json:
+        print(json.dumps([dict(asdict(result), key=result.key) for result in results], indent=2))
+    else:
+        print(format_report(results))
+
+    if args.save_baseline:
+        data = {result.key: asdict(result) for result in results}
+        args.baseline.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"baseline saved: {args.baseline}")
+    if args.check:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        problems = find_regressions(results, baseline)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
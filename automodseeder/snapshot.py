@@ -0,0 +1,128 @@
+"""JSON-lines snapshots of a guild's seeded rules.
+
+The first line is a header (format version, source guild, rule count and
+count per trigger type); every following line is one rule. Imports read the
+file as a stream and record the byte offset of the next unread rule, so an
+interrupted import resumes from that offset instead of the start.
+"""
+import asyncio
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+SNAPSHOT_VERSION = 1
+READ_AHEAD = 32
+
+
+class SnapshotError(ValueError):
+    """The file is not a snapshot this version can read."""
+
+
+class SnapshotRule(NamedTuple):
+    name: str
+    trigger_type: int
+    enabled: bool
+    action_mode: str
+    keywords: List[str]
+
+    @property
+    def token(self) -> str:
+        return self.name.rsplit(" ", 1)[-1]
+
+    def to_line(self) -> str:
+        return json.dumps(
+            {"n": self.name, "t": self.trigger_type, "e": self.enabled, "a": self.action_mode, "k": self.keywords},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> "SnapshotRule":
+        data = json.loads(line)
+        return cls(data["n"], data["t"], data["e"], data["a"], data.get("k") or [])
+
+
+def write_snapshot(path: Union[str, Path], guild_id: int, rules: Iterable[SnapshotRule]) -> int:
+    """Write ``rules`` to ``path`` atomically; returns the number of rules written."""
+    rules = list(rules)
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "guild_id": guild_id,
+        "rules": len(rules),
+        "trigger_types": {str(key): count for key, count in Counter(rule.trigger_type for rule in rules).items()},
+    }
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as file:
+        file.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for rule in rules:
+            file.write(rule.to_line() + "\n")
+    os.replace(tmp_path, path)
+    return len(rules)
+
+
+def read_header(path: Union[str, Path]) -> Tuple[Dict[str, Any], int]:
+    """Return the header and the byte offset of the first rule."""
+    with Path(path).open("rb") as file:
+        line = file.readline()
+        try:
+            header = json.loads(line)
+        except ValueError:
+            raise SnapshotError("스냅샷 헤더를 읽을 수 없습니다") from None
+        if not isinstance(header, dict) or header.get("version") != SNAPSHOT_VERSION:
+            raise SnapshotError("지원하지 않는 스냅샷 버전입니다")
+        return header, file.tell()
+
+
+def _read_chunk(path: Path, offset: int, limit: int) -> List[Tuple[SnapshotRule, int]]:
+    entries = []
+    with path.open("rb") as file:
+        file.seek(offset)
+        while len(entries) < limit:
+            line = file.readline()
+            if not line:
+                break
+            if line.strip():
+                entries.append((SnapshotRule.from_line(line.decode("utf-8")), file.tell()))
+    return entries
+
+
+class SnapshotStream:
+    """Reads a snapshot from ``offset`` in chunks, one chunk ahead of the consumer.
+
+    ``next`` returns a rule and the offset just past it (the resume marker),
+    or None at the end. While the caller works on one chunk the next is read
+    in the default executor, so file reads overlap the creates.
+    """
+
+    def __init__(self, path: Union[str, Path], offset: int, *, read_ahead: int = READ_AHEAD) -> None:
+        self._path = Path(path)
+        self._offset = offset
+        self._read_ahead = read_ahead
+        self._buffer: List[Tuple[SnapshotRule, int]] = []
+        self._pending: Optional[asyncio.Future] = None
+        self._done = False
+
+    def _prefetch(self) -> None:
+        if self._pending is None and not self._done:
+            loop = asyncio.get_running_loop()
+            self._pending = loop.run_in_executor(None, _read_chunk, self._path, self._offset, self._read_ahead)
+
+    async def next(self) -> Optional[Tuple[SnapshotRule, int]]:
+        if not self._buffer:
+            self._prefetch()
+            if self._pending is None:
+                return None
+            chunk = await self._pending
+            self._pending = None
+            if len(chunk) < self._read_ahead:
+                self._done = True
+            if chunk:
+                self._offset = chunk[-1][1]
+            self._buffer = chunk[::-1]
+            if not self._buffer:
+                return None
+            self._prefetch()
+        return self._buffer.pop()
@@ -0,0 +1,255 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seeded_rules (
+    guild_id INTEGER NOT NULL,
+    rule_id INTEGER NOT NULL,
+    created_ts INTEGER NOT NULL,
+    enabled INTEGER NOT NULL,
+    keyword_count INTEGER NOT NULL,
+    expires_ts INTEGER,
+    PRIMARY KEY (guild_id, rule_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    token TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    rule_id INTEGER,
+    ts INTEGER NOT NULL,
+    expires_ts INTEGER
+);
+CREATE INDEX IF NOT EXISTS journal_token ON journal (guild_id, token);
+"""
+# Runs after the column migration, so stores from before TTLs get it too.
+EXPIRY_INDEX = """
+CREATE INDEX IF NOT EXISTS seeded_expiry ON seeded_rules (expires_ts) WHERE expires_ts IS NOT NULL;
+"""
+
+JOURNAL_INTENT = "intent"
+
+
+class SeedRecord(NamedTuple):
+    guild_id: int
+    rule_id: int
+    created_ts: int
+    enabled: bool
+    keyword_count: int
+    # Unix time after which the rule is deleted; None keeps it until purged.
+    expires_ts: Optional[int] = None
+
+
+class SeedStore:
+    """SQLite-backed record of the rules this cog created.
+
+    Rows are keyed by (guild_id, rule_id), so per-guild scans use the primary
+    key and single inserts/deletes never rewrite a guild's whole list the way
+    the old ``seeded_rule_ids`` Config list did.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._conn = sqlite3.connect(str(path), isolation_level=None)
+        if str(path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # An intent must be on disk before its create request goes out.
+            self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(SCHEMA)
+        for table in ("seeded_rules", "journal"):
+            columns = {row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            if "expires_ts" not in columns:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN expires_ts INTEGER")
+        self._conn.executescript(EXPIRY_INDEX)
+        # Waiting for the next group commit: intents as (guild_id, token,
+        # expires_ts, ts), outcomes as (guild_id, token, record or None).
+        self._intents: List[Tuple[int, str, Optional[int], int]] = []
+        self._outcomes: List[Tuple[int, str, Optional[SeedRecord]]] = []
+        self._commit: Optional[asyncio.Future] = None
+
+    def close(self) -> None:
+        self.commit_journal()
+        self._conn.close()
+
+    def ids(self, guild_id: int) -> List[int]:
+        rows = self._conn.execute(
+            "SELECT rule_id FROM seeded_rules WHERE guild_id = ? ORDER BY created_ts, rule_id",
+            (guild_id,),
+        )
+        return [row[0] for row in rows]
+
+    def records(self, guild_id: int) -> List[SeedRecord]:
+        rows = self._conn.execute(
+            "SELECT guild_id, rule_id, created_ts, enabled, keyword_count, expires_ts FROM seeded_rules"
+            " WHERE guild_id = ? ORDER BY created_ts, rule_id",
+            (guild_id,),
+        )
+        return [SeedRecord(g, r, c, bool(e), k, x) for g, r, c, e, k, x in rows]
+
+    def has(self, guild_id: int, rule_id: int) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM seeded_rules WHERE guild_id = ? AND rule_id = ?", (guild_id, rule_id)
+        ).fetchone()
+        return row is not None
+
+    def expiring(self) -> List[Tuple[int, int, int]]:
+        """``(expires_ts, guild_id, rule_id)`` for every rule with a TTL, across all guilds."""
+        rows = self._conn.execute(
+            "SELECT expires_ts, guild_id, rule_id FROM seeded_rules WHERE expires_ts IS NOT NULL"
+        )
+        return [tuple(row) for row in rows]
+
+    def next_expiry(self, guild_id: int) -> Tuple[int, Optional[int]]:
+        """How many of the guild's rules have a TTL, and the earliest deadline."""
+        row = self._conn.execute(
+            "SELECT COUNT(expires_ts), MIN(expires_ts) FROM seeded_rules WHERE guild_id = ?",
+            (guild_id,),
+        ).fetchone()
+        return row[0], row[1]
+
+    def guilds(self) -> List[int]:
+        return [row[0] for row in self._conn.execute("SELECT DISTINCT guild_id FROM seeded_rules")]
+
+    def add(self, records: Iterable[SeedRecord]) -> None:
+        with self._transaction():
+            self._insert(records)
+
+    def remove(self, guild_id: int, rule_ids: Iterable[int]) -> int:
+        with self._transaction():
+            cursor = self._conn.executemany(
+                "DELETE FROM seeded_rules WHERE guild_id = ? AND rule_id = ?",
+                [(guild_id, rule_id) for rule_id in rule_ids],
+            )
+        return cursor.rowcount
+
+    def sync(
+        self,
+        guild_id: int,
+        *,
+        add: Iterable[SeedRecord],
+        remove: Iterable[int],
+        compact_through: Optional[int] = None,
+    ) -> None:
+        """Add and remove rows for one guild in a single transaction.
+
+        ``compact_through`` also drops the guild's journal rows up to that
+        sequence number, once their intents are resolved into ``add``.
+        """
+        with self._transaction():
+            self._conn.executemany(
+                "DELETE FROM seeded_rules WHERE guild_id = ? AND rule_id = ?",
+                [(guild_id, rule_id) for rule_id in remove],
+            )
+            self._insert(add)
+            if compact_through is not None:
+                self._conn.execute(
+                    "DELETE FROM journal WHERE guild_id = ? AND seq <= ?", (guild_id, compact_through)
+                )
+
+    def _insert(self, records: Iterable[SeedRecord]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO seeded_rules"
+            " (guild_id, rule_id, created_ts, enabled, keyword_count, expires_ts) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (r.guild_id, r.rule_id, r.created_ts, int(r.enabled), r.keyword_count, r.expires_ts)
+                for r in records
+            ],
+        )
+
+    # ---------------------
+    # Create journal
+    # ---------------------
+    # Every create records an intent, keyed by the token in the rule name, and
+    # waits until it is on disk before the request goes out. The outcome
+    # (with the seeded_rules row of a created rule) is written the same way
+    # and deletes the resolved intent, so the journal only ever holds creates
+    # whose result is unknown. Writes from every guild worker queued in the
+    # same event loop pass are group-committed in one transaction.
+
+    async def journal_intent(
+        self, guild_id: int, token: str, expires_ts: Optional[int] = None
+    ) -> None:
+        self._intents.append((guild_id, token, expires_ts, int(time.time())))
+        await self._group_commit()
+
+    async def journal_outcome(self, guild_id: int, token: str, record: Optional[SeedRecord]) -> None:
+        """Record the outcome of an intent; ``None`` means the create definitely failed."""
+        self._outcomes.append((guild_id, token, record))
+        await self._group_commit()
+
+    async def _group_commit(self) -> None:
+        if self._commit is None:
+            loop = asyncio.get_running_loop()
+            self._commit = loop.create_future()
+            loop.call_soon(self._commit_pending)
+        await asyncio.shield(self._commit)
+
+    def _commit_pending(self) -> None:
+        future, self._commit = self._commit, None
+        try:
+            self.commit_journal()
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
+
+    def commit_journal(self) -> None:
+        if not self._intents and not self._outcomes:
+            return
+        intents, self._intents = self._intents, []
+        outcomes, self._outcomes = self._outcomes, []
+        with self._transaction():
+            self._conn.executemany(
+                "INSERT INTO journal (guild_id, token, kind, rule_id, ts, expires_ts) VALUES (?, ?, ?, NULL, ?, ?)",
+                [(guild_id, token, JOURNAL_INTENT, ts, expires_ts) for guild_id, token, expires_ts, ts in intents],
+            )
+            self._insert([record for _, _, record in outcomes if record is not None])
+            self._conn.executemany(
+                "DELETE FROM journal WHERE guild_id = ? AND token = ?",
+                [(guild_id, token) for guild_id, token, _ in outcomes],
+            )
+
+    def open_intents(self, guild_id: int) -> Dict[str, Optional[int]]:
+        """Tokens whose create was sent but never resolved, with their deadline."""
+        # Stores from before compaction may still hold resolved outcome rows.
+        rows = self._conn.execute(
+            "SELECT token, MAX(expires_ts) FROM journal WHERE guild_id = ? GROUP BY token"
+            " HAVING SUM(kind != ?) = 0 ORDER BY MIN(seq)",
+            (guild_id, JOURNAL_INTENT),
+        )
+        return dict(rows.fetchall())
+
+    def journal_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM journal").fetchone()[0]
+
+    def journal_guilds(self) -> List[int]:
+        return [row[0] for row in self._conn.execute("SELECT DISTINCT guild_id FROM journal")]
+
+    def set_enabled(self, guild_id: int, rule_ids: Iterable[int], enabled: bool) -> None:
+        with self._transaction():
+            self._conn.executemany(
+                "UPDATE seeded_rules SET enabled = ? WHERE guild_id = ? AND rule_id = ?",
+                [(int(enabled), guild_id, rule_id) for rule_id in rule_ids],
+            )
+
+    def set_keyword_count(self, guild_id: int, rule_id: int, keyword_count: int) -> None:
+        self._conn.execute(
+            "UPDATE seeded_rules SET keyword_count = ? WHERE guild_id = ? AND rule_id = ?",
+            (keyword_count, guild_id, rule_id),
+        )
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._conn)
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> None:
+        self._conn.execute("BEGIN")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
@@ -0,0 +1,193 @@
+"""Local checks for AutoMod rule payloads, run before a create/edit is sent.
+
+The limits are Discord's documented ones. Regex patterns are compiled with
+Python's ``re`` after rejecting constructs the Rust regex engine Discord
+uses does not support (look-around, backreferences, atomic groups,
+conditionals), so a pattern that passes here is in the common subset.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Pattern
+
+from .planner import (
+    TRIGGER_TYPE_KEYWORD,
+    TRIGGER_TYPE_KEYWORD_PRESET,
+    TRIGGER_TYPE_MEMBER_PROFILE,
+    TRIGGER_TYPE_MENTION_SPAM,
+)
+
+MAX_RULE_NAME_LENGTH = 100
+MAX_KEYWORDS_PER_RULE = 1000
+MAX_KEYWORD_LENGTH = 60
+MAX_REGEX_PATTERNS = 10
+MAX_REGEX_LENGTH = 260
+MAX_ALLOW_LIST = 100
+MAX_PRESET_ALLOW_LIST = 1000
+MAX_MENTION_TOTAL_LIMIT = 50
+MAX_CUSTOM_MESSAGE_LENGTH = 150
+MAX_TIMEOUT_SECONDS = 2419200
+MAX_EXEMPT_ROLES = 20
+MAX_EXEMPT_CHANNELS = 50
+
+EVENT_TYPE_MESSAGE_SEND = 1
+EVENT_TYPE_MEMBER_UPDATE = 2
+
+ACTION_BLOCK_MESSAGE = 1
+ACTION_SEND_ALERT = 2
+ACTION_TIMEOUT = 3
+ACTION_BLOCK_MEMBER_INTERACTION = 4
+
+KEYWORD_PRESETS = {1, 2, 3}
+
+# trigger_metadata fields each trigger type accepts.
+METADATA_FIELDS = {
+    TRIGGER_TYPE_KEYWORD: {"keyword_filter", "regex_patterns", "allow_list"},
+    TRIGGER_TYPE_KEYWORD_PRESET: {"presets", "allow_list"},
+    TRIGGER_TYPE_MENTION_SPAM: {"mention_total_limit", "mention_raid_protection_enabled"},
+    TRIGGER_TYPE_MEMBER_PROFILE: {"keyword_filter", "regex_patterns", "allow_list"},
+}
+TIMEOUT_TRIGGER_TYPES = {TRIGGER_TYPE_KEYWORD, TRIGGER_TYPE_MENTION_SPAM}
+
+_UNSUPPORTED_REGEX = (
+    (re.compile(r"\(\?<?[=!]"), "look-around"),
+    (re.compile(r"\\[1-9]|\(\?P="), "backreference"),
+    (re.compile(r"\(\?>"), "atomic group"),
+    (re.compile(r"\(\?\("), "conditional"),
+    (re.compile(r"[*+?}]\+"), "possessive quantifier"),
+)
+
+
+class PayloadError(ValueError):
+    """A rule payload breaks a documented AutoMod limit.
+
+    ``errors`` maps the offending field path (``trigger_metadata.keyword_filter.3``)
+    to a message.
+    """
+
+    def __init__(self, errors: Dict[str, str]) -> None:
+        self.errors = errors
+        super().__init__("; ".join(f"{path}: {message}" for path, message in errors.items()))
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> Pattern:
+    """Compile ``pattern`` if it is in the Rust/Python regex subset, else raise ValueError."""
+    for check, name in _UNSUPPORTED_REGEX:
+        if check.search(pattern):
+            raise ValueError(f"지원하지 않는 정규식 문법({name})")
+    try:
+        return re.compile(pattern)
+    except re.error as exc:
+        raise ValueError(f"정규식 오류: {exc.msg}") from None
+
+
+def _check_strings(
+    errors: Dict[str, str], path: str, values: Any, max_items: int, max_length: int
+) -> List[str]:
+    if not isinstance(values, list):
+        errors[path] = "목록이어야 합니다"
+        return []
+    if len(values) > max_items:
+        errors[path] = f"최대 {max_items}개 (현재 {len(values)}개)"
+    for index, value in enumerate(values):
+        if not isinstance(value, str) or not 1 <= len(value) <= max_length:
+            errors[f"{path}.{index}"] = f"1~{max_length}자 문자열이어야 합니다"
+    return [value for value in values if isinstance(value, str)]
+
+
+def _check_metadata(errors: Dict[str, str], metadata: Mapping[str, Any], trigger_type: int) -> None:
+    allowed = METADATA_FIELDS.get(trigger_type, set())
+    for key in metadata:
+        if key not in allowed:
+            errors[f"trigger_metadata.{key}"] = "이 트리거 타입에서 지원하지 않는 필드"
+    if "keyword_filter" in metadata and "keyword_filter" in allowed:
+        _check_strings(
+            errors, "trigger_metadata.keyword_filter", metadata["keyword_filter"],
+            MAX_KEYWORDS_PER_RULE, MAX_KEYWORD_LENGTH,
+        )
+    if "regex_patterns" in metadata and "regex_patterns" in allowed:
+        patterns = _check_strings(
+            errors, "trigger_metadata.regex_patterns", metadata["regex_patterns"],
+            MAX_REGEX_PATTERNS, MAX_REGEX_LENGTH,
+        )
+        for index, pattern in enumerate(patterns):
+            try:
+                compile_pattern(pattern)
+            except ValueError as exc:
+                errors.setdefault(f"trigger_metadata.regex_patterns.{index}", str(exc))
+    if "allow_list" in metadata and "allow_list" in allowed:
+        limit = MAX_PRESET_ALLOW_LIST if trigger_type == TRIGGER_TYPE_KEYWORD_PRESET else MAX_ALLOW_LIST
+        _check_strings(errors, "trigger_metadata.allow_list", metadata["allow_list"], limit, MAX_KEYWORD_LENGTH)
+    if "presets" in metadata and "presets" in allowed:
+        presets = metadata["presets"]
+        if not isinstance(presets, list) or not set(presets) <= KEYWORD_PRESETS:
+            errors["trigger_metadata.presets"] = "1(욕설), 2(성적 콘텐츠), 3(비하 표현)만 가능"
+    if "mention_total_limit" in metadata and "mention_total_limit" in allowed:
+        limit = metadata["mention_total_limit"]
+        if not isinstance(limit, int) or not 0 <= limit <= MAX_MENTION_TOTAL_LIMIT:
+            errors["trigger_metadata.mention_total_limit"] = f"0~{MAX_MENTION_TOTAL_LIMIT} 정수여야 합니다"
+
+
+def _is_snowflake(value: Any) -> bool:
+    return isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+
+
+def _check_actions(errors: Dict[str, str], actions: Any, trigger_type: int) -> None:
+    if not isinstance(actions, list) or not actions:
+        errors["actions"] = "동작이 1개 이상 필요합니다"
+        return
+    for index, action in enumerate(actions):
+        path = f"actions.{index}"
+        action_type = action.get("type")
+        metadata = action.get("metadata") or {}
+        if action_type == ACTION_BLOCK_MESSAGE:
+            message = metadata.get("custom_message")
+            if message is not None and len(message) > MAX_CUSTOM_MESSAGE_LENGTH:
+                errors[f"{path}.metadata.custom_message"] = f"최대 {MAX_CUSTOM_MESSAGE_LENGTH}자"
+        elif action_type == ACTION_SEND_ALERT:
+            if not _is_snowflake(metadata.get("channel_id")):
+                errors[f"{path}.metadata.channel_id"] = "alert 동작에는 channel_id가 필요합니다"
+        elif action_type == ACTION_TIMEOUT:
+            if trigger_type not in TIMEOUT_TRIGGER_TYPES:
+                errors[f"{path}.type"] = "timeout은 keyword/mention_spam 규칙에서만 가능"
+            duration = metadata.get("duration_seconds")
+            if not isinstance(duration, int) or not 0 <= duration <= MAX_TIMEOUT_SECONDS:
+                errors[f"{path}.metadata.duration_seconds"] = f"0~{MAX_TIMEOUT_SECONDS} 정수여야 합니다"
+        elif action_type == ACTION_BLOCK_MEMBER_INTERACTION:
+            if trigger_type != TRIGGER_TYPE_MEMBER_PROFILE:
+                errors[f"{path}.type"] = "member_profile 규칙에서만 가능"
+        else:
+            errors[f"{path}.type"] = f"알 수 없는 동작 타입: {action_type}"
+
+
+def validate_rule_payload(
+    payload: Mapping[str, Any], trigger_type: Optional[int] = None, *, partial: bool = False
+) -> None:
+    """Raise ``PayloadError`` listing every field of ``payload`` that Discord would reject.
+
+    ``partial`` is for edits: required fields may be missing. Edits pass the
+    existing rule's ``trigger_type``, which cannot change.
+    """
+    errors: Dict[str, str] = {}
+    if trigger_type is None:
+        trigger_type = payload.get("trigger_type")
+    if not partial:
+        for key in ("name", "event_type", "trigger_type", "actions"):
+            if key not in payload:
+                errors[key] = "필수 항목입니다"
+    if "name" in payload and not 1 <= len(payload["name"] or "") <= MAX_RULE_NAME_LENGTH:
+        errors["name"] = f"1~{MAX_RULE_NAME_LENGTH}자여야 합니다"
+    if "event_type" in payload:
+        expected = EVENT_TYPE_MEMBER_UPDATE if trigger_type == TRIGGER_TYPE_MEMBER_PROFILE else EVENT_TYPE_MESSAGE_SEND
+        if payload["event_type"] != expected:
+            errors["event_type"] = f"이 트리거 타입은 event_type {expected}만 가능"
+    if "trigger_metadata" in payload:
+        _check_metadata(errors, payload["trigger_metadata"] or {}, trigger_type)
+    if "actions" in payload:
+        _check_actions(errors, payload["actions"], trigger_type)
+    if len(payload.get("exempt_roles") or []) > MAX_EXEMPT_ROLES:
+        errors["exempt_roles"] = f"최대 {MAX_EXEMPT_ROLES}개"
+    if len(payload.get("exempt_channels") or []) > MAX_EXEMPT_CHANNELS:
+        errors["exempt_channels"] = f"최대 {MAX_EXEMPT_CHANNELS}개"
+    if errors:
+        raise PayloadError(errors)